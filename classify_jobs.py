@@ -23,7 +23,7 @@ logging.basicConfig(
 logger = logging.getLogger("classify_jobs")
 
 class JobClassifyOrchestrator:
-    def __init__(self, dry_run: bool = False, batch_size: int = 50, confidence_threshold: float = 0.5):
+    def __init__(self, dry_run: bool = False, batch_size: int = 50, confidence_threshold: float = 0.5, optimize: bool = False):
         self.dry_run = dry_run
         self.batch_size = batch_size
         self.audit_log = Path("classification_audit.log")
@@ -34,7 +34,7 @@ class JobClassifyOrchestrator:
             self.api_client = get_api_client()
             self.persistence = JobPersistence(self.api_client)
             self.preprocessor = BERTPreprocessor()
-            self.classifier = BertJobClassifier(threshold=confidence_threshold)
+            self.classifier = BertJobClassifier(threshold=confidence_threshold, optimize=optimize)
             logger.info("✓ All components initialized")
         except Exception as e:
             logger.error(f"Failed to initialize components: {e}")
@@ -43,19 +43,21 @@ class JobClassifyOrchestrator:
     def run(self):
         logger.info(f"Starting classification cycle (Dry Run: {self.dry_run}, Batch: {self.batch_size})")
         
+        backoff = 1
         while True:
             # 1. Fetch raw jobs
-            raw_jobs, _ = self.persistence.fetch_raw_jobs(limit=self.batch_size)
+            raw_jobs, total_fetched = self.persistence.fetch_raw_jobs(limit=self.batch_size)
             if not raw_jobs:
                 logger.info("No new raw jobs to process. Exiting.")
                 break
             
             logger.info(f"Processing batch of {len(raw_jobs)} raw jobs...")
             
+            # 2. Preprocess
+            prepared = []
             for raw_job in raw_jobs:
                 raw_id = raw_job.get('id')
                 try:
-                    # 2. Preprocess
                     input_text = self.preprocessor.format_input(
                         title=raw_job.get('raw_title'),
                         company=raw_job.get('raw_company'),
@@ -63,10 +65,17 @@ class JobClassifyOrchestrator:
                         description=raw_job.get('raw_description')
                     )
                     logger.info(f"ID: {raw_id} | Input Text: {input_text}")
-                    
-                    # 3. Classify
-                    result = self.classifier.classify(input_text)
-                    
+                    prepared.append((raw_job, input_text))
+                except Exception as e:
+                    logger.error(f"Error processing raw job ID {raw_id}: {e}")
+
+            # 3. Classify the whole batch in batched forward passes
+            results = self.classifier.batch_classify([input_text for _, input_text in prepared])
+
+            marked = 0
+            for (raw_job, _), result in zip(prepared, results):
+                raw_id = raw_job.get('id')
+                try:
                     # Audit logging
                     self._log_audit(raw_id, result)
                     
@@ -94,6 +103,7 @@ class JobClassifyOrchestrator:
                     if not self.dry_run:
                         success = self.persistence.update_raw_status(raw_id, "parsed")
                         if success:
+                            marked += 1
                             logger.info(f"ID: {raw_id} | Status updated to 'parsed'")
                         
                 except Exception as e:
@@ -104,7 +114,14 @@ class JobClassifyOrchestrator:
                 logger.info("[DRY RUN] Finished first batch. Exiting.")
                 break
             
-            time.sleep(1) # Prevent hammering the API
+            # A full page that moved rows out of 'new' means more work is already
+            # waiting. Otherwise back off: the queue is draining, or nothing was
+            # marked (API errors) and the next fetch returns the same rows
+            if total_fetched < self.batch_size or marked == 0:
+                time.sleep(backoff) # Prevent hammering the API
+                backoff = min(30, backoff * 2)
+            else:
+                backoff = 1
 
     def _log_audit(self, raw_id: int, result: dict):
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
@@ -120,12 +137,14 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Run without writing to DB/API")
     parser.add_argument("--batch-size", type=int, default=50, help="Number of records per batch")
     parser.add_argument("--threshold", type=float, default=0.5, help="Confidence threshold")
+    parser.add_argument("--optimize", action="store_true", help="FP16 on GPU / INT8 dynamic quantization on CPU (validate accuracy first)")
     args = parser.parse_args()
     
     orchestrator = JobClassifyOrchestrator(
         dry_run=args.dry_run, 
         batch_size=args.batch_size,
-        confidence_threshold=args.threshold
+        confidence_threshold=args.threshold,
+        optimize=args.optimize
     )
     orchestrator.run()
 
@@ -356,7 +356,10 @@ class LLMJobClassifyOrchestrator:
             # Print intermediate stats
             print(f"\nStats so far: Classified Valid: {stats['classified_valid']} | Finalized NER: {stats['finalized_after_ner']} | Junk: {stats['junk']}")
             
-            time.sleep(1)
+            # A full page means more work is already waiting; only pause when the
+            # queue is draining
+            if total_fetched < self.batch_size:
+                time.sleep(1)
         
         # Final Report
         print("\n" + "="*60)
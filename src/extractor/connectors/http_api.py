@@ -3,6 +3,7 @@ import logging
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 import os
+import threading
 import time
 
 logger = logging.getLogger(__name__)
@@ -184,8 +185,13 @@ class APIClient:
         response.raise_for_status()
         return response.json()
 
+# Shared clients keyed by configuration: each APIClient holds an httpx connection
+# pool and a bearer token, so callers reuse both instead of logging in again
+_api_clients: Dict[tuple, APIClient] = {}
+_api_clients_lock = threading.Lock()
+
 def get_api_client() -> APIClient:
-    """Factory function for APIClient"""
+    """Factory function for APIClient (one shared client per configuration)"""
     base_url = os.getenv('API_BASE_URL')
     email = os.getenv('API_EMAIL')
     password = os.getenv('API_PASSWORD')
@@ -194,4 +200,10 @@ def get_api_client() -> APIClient:
     if not all([base_url, email, password, employee_id]):
         raise ValueError("Missing required environment variables")
     
-    return APIClient(base_url, email, password, employee_id)
+    key = (base_url, email, password, employee_id)
+    with _api_clients_lock:
+        client = _api_clients.get(key)
+        if client is None:
+            client = APIClient(base_url, email, password, employee_id)
+            _api_clients[key] = client
+    return client
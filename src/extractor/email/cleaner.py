@@ -1,9 +1,37 @@
 import re
 from bs4 import BeautifulSoup
 import logging
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# lxml (requirements.txt) is a C parser, several times faster than the
+# pure-Python html.parser on large marketing-style HTML bodies
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# Reply/forward markers; the text is cut at the first match of each, in order
+_QUOTED_REPLY_RES = tuple(re.compile(pattern, re.MULTILINE) for pattern in (
+    r"On .+ wrote:",
+    r"From:.+Sent:.+To:.+Subject:",
+    r"_{5,}",  # Long underscores (email separators)
+    r"-{5,}",  # Long dashes (email separators)
+    r"Begin forwarded message:",
+    r"\bwrote:\s*$",  # Standalone "wrote:" at end of line
+))
+
+# "Sent from my iPhone / Android / ..." device signatures (common in plain-text)
+_DEVICE_SIGNATURE_RE = re.compile(
+    r'\n\s*Sent from my (iPhone|Android|iPad|Samsung|BlackBerry|Windows Phone|mobile device)[^\n]*',
+    re.IGNORECASE
+)
+
+_MULTI_SPACE_RE = re.compile(r' +')
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+
 class EmailCleaner:
     """Clean and sanitize email content for extraction"""
     
@@ -21,7 +49,7 @@ class EmailCleaner:
             Clean text content
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = BeautifulSoup(html_content, _HTML_PARSER)
             
             # Remove script and style elements
             for script in soup(["script", "style"]):
@@ -45,18 +73,10 @@ class EmailCleaner:
     def _remove_quoted_replies(self, text: str) -> str:
         """Remove quoted email replies and forwarded messages"""
         # Common reply patterns (split at first occurrence)
-        split_patterns = [
-            r"On .+ wrote:",
-            r"From:.+Sent:.+To:.+Subject:",
-            r"_{5,}",  # Long underscores (email separators)
-            r"-{5,}",  # Long dashes (email separators)
-            r"Begin forwarded message:",
-            r"\bwrote:\s*$",  # Standalone "wrote:" at end of line
-        ]
-
-        for pattern in split_patterns:
-            parts = re.split(pattern, text, maxsplit=1, flags=re.MULTILINE)
-            text = parts[0]
+        for pattern in _QUOTED_REPLY_RES:
+            match = pattern.search(text)
+            if match:
+                text = text[:match.start()]
 
         # Strip lines that begin with ">" (standard plain-text quoted reply format)
         # e.g.  > On Mon, Jan 1 John Doe <john@x.com> wrote:
@@ -71,34 +91,52 @@ class EmailCleaner:
         text = '\n'.join(cleaned_lines)
 
         # Remove "Sent from my iPhone / Android / …" device signatures (common in plain-text)
-        text = re.sub(
-            r'\n\s*Sent from my (iPhone|Android|iPad|Samsung|BlackBerry|Windows Phone|mobile device)[^\n]*',
-            '',
-            text,
-            flags=re.IGNORECASE
-        )
+        text = _DEVICE_SIGNATURE_RE.sub('', text)
 
         return text
     
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize excessive whitespace and blank lines"""
-        # Replace multiple spaces with single space
-        text = re.sub(r' +', ' ', text)
+        # Replace multiple spaces with single space (a substring test is far
+        # cheaper than a regex pass over a body that has nothing to collapse)
+        if '  ' in text:
+            text = _MULTI_SPACE_RE.sub(' ', text)
         
         # Replace multiple newlines with max 2
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        if '\n\n\n' in text:
+            text = _MULTI_NEWLINE_RE.sub('\n\n', text)
         
         # Remove trailing/leading whitespace from each line
         lines = [line.strip() for line in text.split('\n')]
         
         return '\n'.join(lines)
     
-    def extract_body(self, email_message) -> str:
+    def index_parts(self, email_message) -> Dict[str, List]:
+        """
+        Group a message's MIME parts by content type, in walk order
+        
+        One tree walk that the calendar check and extract_body can share.
+        """
+        parts = {}
+        for part in email_message.walk():
+            parts.setdefault(part.get_content_type(), []).append(part)
+        return parts
+    
+    def _last_decoded_payload(self, parts: List) -> Optional[str]:
+        """Decode the last part with a non-empty payload (later parts win, as in a walk)"""
+        for part in reversed(parts):
+            payload = part.get_payload(decode=True)
+            if payload:
+                return payload.decode('utf-8', errors='ignore')
+        return None
+    
+    def extract_body(self, email_message, parts: Optional[Dict[str, List]] = None) -> str:
         """
         Extract email body from message object with better cleaning
         
         Args:
             email_message: Email message object
+            parts: index_parts() of the message, if already built
             
         Returns:
             Clean email body text
@@ -107,23 +145,12 @@ class EmailCleaner:
         
         try:
             if email_message.is_multipart():
-                text_body = None
-                html_body = None
+                if parts is None:
+                    parts = self.index_parts(email_message)
                 
-                for part in email_message.walk():
-                    content_type = part.get_content_type()
-                    
-                    # Get plain text
-                    if content_type == 'text/plain':
-                        payload = part.get_payload(decode=True)
-                        if payload:
-                            text_body = payload.decode('utf-8', errors='ignore')
-                    
-                    # Get HTML
-                    elif content_type == 'text/html':
-                        payload = part.get_payload(decode=True)
-                        if payload:
-                            html_body = payload.decode('utf-8', errors='ignore')
+                # Get plain text and HTML
+                text_body = self._last_decoded_payload(parts.get('text/plain', ()))
+                html_body = self._last_decoded_payload(parts.get('text/html', ()))
                 
                 # Prefer text, fallback to HTML
                 body = text_body if text_body else (self.clean_html(html_body) if html_body else "")
@@ -1,10 +1,14 @@
 import email
+import re
 from email.header import decode_header
 from typing import List, Dict, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# UID item in the header line of one message's FETCH response
+_FETCH_UID_RE = re.compile(rb'\bUID (\d+)')
+
 class EmailReader:
     """Read and fetch emails from IMAP connection"""
     
@@ -70,11 +74,17 @@ class EmailReader:
             
             self.logger.info(f"Fetching {len(batch_uids)} emails (batch {start_index}-{end_index}/{total_emails})")
             
-            # Fetch emails
+            # Fetch the whole batch in one UID FETCH round trip; anything the
+            # batch response lacks is fetched on its own as before
+            raw_by_uid = self._fetch_batch_raw(batch_uids)
             emails = []
             for uid in batch_uids:
                 try:
-                    email_data = self._fetch_single_email(uid)
+                    raw_email = raw_by_uid.get(uid)
+                    if raw_email:
+                        email_data = self._parse_email(uid, raw_email)
+                    else:
+                        email_data = self._fetch_single_email(uid)
                     if email_data:
                         emails.append(email_data)
                 except Exception as e:
@@ -88,6 +98,42 @@ class EmailReader:
             self.logger.error(f"Error in fetch_emails: {str(e)}")
             return [], None
     
+    def _fetch_batch_raw(self, uids: List[bytes]) -> Dict[bytes, bytes]:
+        """
+        Fetch raw messages for several UIDs with a single UID FETCH command
+        
+        Returns:
+            Dict of UID -> raw RFC822 bytes (empty if the batch fetch failed)
+        """
+        if not uids:
+            return {}
+        try:
+            status, msg_data = self.connector.connection.uid('fetch', b','.join(uids), '(UID RFC822)')
+            if status != 'OK' or not msg_data:
+                self.logger.warning(f"Batch fetch failed ({status}), fetching emails one by one")
+                return {}
+            
+            raw_by_uid = {}
+            for position, item in enumerate(msg_data):
+                # Message parts are (header line, literal) tuples; the bytes item
+                # after each closes it. Other bytes items (unsolicited FLAGS
+                # updates) carry no literal and are skipped
+                if not isinstance(item, tuple) or len(item) < 2:
+                    continue
+                uid_match = _FETCH_UID_RE.search(item[0])
+                if not uid_match and position + 1 < len(msg_data):
+                    # Servers may send UID after the literal: b' UID 7)'. A new
+                    # response would start with its sequence number instead
+                    tail = msg_data[position + 1]
+                    if isinstance(tail, bytes) and tail[:1] in (b' ', b')'):
+                        uid_match = _FETCH_UID_RE.search(tail)
+                if uid_match and item[1]:
+                    raw_by_uid[uid_match.group(1)] = item[1]
+            return raw_by_uid
+        except Exception as e:
+            self.logger.warning(f"Batch fetch failed ({str(e)}), fetching emails one by one")
+            return {}
+    
     def _fetch_single_email(self, uid) -> Optional[Dict]:
         """Fetch a single email by UID with better parsing"""
         try:
@@ -100,6 +146,14 @@ class EmailReader:
             if not raw_email:
                 return None
             
+            return self._parse_email(uid, raw_email)
+        except Exception as e:
+            self.logger.error(f"Error fetching email UID {uid}: {str(e)}")
+            return None
+    
+    def _parse_email(self, uid, raw_email: bytes) -> Optional[Dict]:
+        """Parse a fetched raw message into the email dict used downstream"""
+        try:
             email_message = email.message_from_bytes(raw_email)
             
             # Validate email has minimum required fields
@@ -117,7 +171,7 @@ class EmailReader:
                 'date': email_message.get('Date', '')
             }
         except Exception as e:
-            self.logger.error(f"Error fetching email UID {uid}: {str(e)}")
+            self.logger.error(f"Error parsing email UID {uid}: {str(e)}")
             return None
     
     @staticmethod
@@ -17,11 +17,15 @@ class BertJobClassifier:
         model_name: str = "distilbert-base-uncased", 
         zero_shot_model: str = "valhalla/distilbart-mnli-12-1",
         device: int = -1, 
-        threshold: float = 0.5
+        threshold: float = 0.5,
+        optimize: bool = False
     ):
         self.logger = logging.getLogger(__name__)
         self.threshold = threshold
+        self.optimize = optimize
         self.model_type = "binary" # Default attempt
+        # Truncated input text -> result; re-sent recruiter blasts repeat verbatim
+        self._result_cache = {}
         
         # Detect device
         if device == -1 and torch.cuda.is_available():
@@ -53,6 +57,7 @@ class BertJobClassifier:
             # Explicitly load tokenizer and model for better control
             tokenizer = AutoTokenizer.from_pretrained(selected_model)
             model = AutoModelForSequenceClassification.from_pretrained(selected_model)
+            model = self._optimize_model(model)
             
             self.classifier = pipeline(
                 "text-classification",
@@ -75,6 +80,7 @@ class BertJobClassifier:
                 model=zero_shot_model,
                 device=self.device
             )
+            self.classifier.model = self._optimize_model(self.classifier.model)
             self.model_type = "zero-shot"
             self.candidate_labels = ["valid job requirement", "junk text or spam"]
             self.valid_labels = ["valid job requirement"]
@@ -83,6 +89,29 @@ class BertJobClassifier:
             self.logger.error(f"Crirical error initializing BERT classifier: {e}")
             raise
 
+    def _optimize_model(self, model):
+        """
+        Lower the model's precision for inference when enabled (opt-in).
+        
+        On GPU the weights are cast to FP16; on CPU the Linear layers (nearly
+        all of a BERT/BART forward pass) are dynamically quantized to INT8.
+        Falls back to the FP32 model if either step fails.
+        """
+        if not self.optimize:
+            return model
+        try:
+            if self.device >= 0:
+                model = model.half()
+                self.logger.info("✓ Model weights cast to FP16 for GPU inference")
+            else:
+                model = torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                self.logger.info("✓ Model Linear layers quantized to INT8 for CPU inference")
+        except Exception as e:
+            self.logger.warning(f"⚠ Model optimization skipped, using FP32: {e}")
+        return model
+
     def classify(self, text: str) -> Dict:
         """
         Perform binary classification on the input text.
@@ -100,29 +129,7 @@ class BertJobClassifier:
 
             if self.model_type == "binary":
                 # Binary classification output format: [{'label': 'label_name', 'score': 0.99}]
-                result = self.classifier(text)[0]
-                label = result['label']
-                score = result['score']
-                
-                # Check for human-readable labels or standard encoded ones
-                valid_keywords = ['valid job requirement', 'valid', 'LABEL_0', '0'] # 0 is mapped to valid in train_bert.py
-                is_valid_label = any(keyword.lower() in label.lower() for keyword in valid_keywords)
-                
-                is_above_threshold = score >= self.threshold
-                is_valid = is_valid_label and is_above_threshold
-                
-                final_label = "valid" if is_valid else "junk"
-                if not is_above_threshold and is_valid_label:
-                    final_label = "low_confidence_valid"
-                elif not is_above_threshold:
-                    final_label = "low_confidence_junk"
-
-                return {
-                    'label': final_label,
-                    'score': float(score),
-                    'is_valid': is_valid,
-                    'raw_label': label
-                }
+                return self._binary_result(self.classifier(text)[0])
             
             else:
                 # Zero-Shot Logic
@@ -131,27 +138,113 @@ class BertJobClassifier:
                     self.candidate_labels, 
                     multi_label=False
                 )
-                
-                top_label = result['labels'][0]
-                top_score = result['scores'][0]
-                
-                is_valid = (top_label in self.valid_labels) and (top_score >= self.threshold)
-                
-                final_label = "valid" if is_valid else "junk"
-                if top_score < self.threshold:
-                    final_label = "low_confidence_junk"
-
-                return {
-                    'label': final_label,
-                    'score': float(top_score),
-                    'is_valid': is_valid,
-                    'raw_label': top_label
-                }
+                return self._zero_shot_result(result)
             
         except Exception as e:
             self.logger.error(f"Classification error: {e}")
             return {'label': 'error', 'score': 0.0, 'is_valid': False}
 
-    def batch_classify(self, texts: List[str]) -> List[Dict]:
-        """Classify a list of job summaries."""
-        return [self.classify(t) for t in texts]
+    def _binary_result(self, result: Dict) -> Dict:
+        """Map one text-classification pipeline output to a classification result"""
+        label = result['label']
+        score = result['score']
+        
+        # Check for human-readable labels or standard encoded ones
+        valid_keywords = ['valid job requirement', 'valid', 'LABEL_0', '0'] # 0 is mapped to valid in train_bert.py
+        is_valid_label = any(keyword.lower() in label.lower() for keyword in valid_keywords)
+        
+        is_above_threshold = score >= self.threshold
+        is_valid = is_valid_label and is_above_threshold
+        
+        final_label = "valid" if is_valid else "junk"
+        if not is_above_threshold and is_valid_label:
+            final_label = "low_confidence_valid"
+        elif not is_above_threshold:
+            final_label = "low_confidence_junk"
+
+        return {
+            'label': final_label,
+            'score': float(score),
+            'is_valid': is_valid,
+            'raw_label': label
+        }
+
+    def _zero_shot_result(self, result: Dict) -> Dict:
+        """Map one zero-shot pipeline output to a classification result"""
+        top_label = result['labels'][0]
+        top_score = result['scores'][0]
+        
+        is_valid = (top_label in self.valid_labels) and (top_score >= self.threshold)
+        
+        final_label = "valid" if is_valid else "junk"
+        if top_score < self.threshold:
+            final_label = "low_confidence_junk"
+
+        return {
+            'label': final_label,
+            'score': float(top_score),
+            'is_valid': is_valid,
+            'raw_label': top_label
+        }
+
+    def batch_classify(self, texts: List[str], batch_size: int = 16) -> List[Dict]:
+        """
+        Classify a list of job summaries, batched through the pipeline.
+        
+        One pipeline call pads and runs up to batch_size texts per forward
+        pass instead of paying tokenizer and model call overhead per text.
+        Identical texts, within the batch or seen in an earlier one, are
+        only run through the model once.
+        
+        Returns:
+            One result dict per input text, in order (same format as classify)
+        """
+        results = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            if not text:
+                results[i] = {'label': 'empty', 'score': 0.0, 'is_valid': False}
+                continue
+            # Handle BERT token limits (approx 512 tokens, ~1000-2000 chars)
+            text = text[:2000]
+            cached = self._result_cache.get(text)
+            if cached is not None:
+                results[i] = dict(cached)
+            else:
+                pending.append((i, text))
+        
+        if not pending:
+            return results
+        
+        inputs = list(dict.fromkeys(text for _, text in pending))
+        try:
+            if self.model_type == "binary":
+                raw_outputs = self.classifier(inputs, batch_size=batch_size)
+                to_result = self._binary_result
+            else:
+                raw_outputs = self.classifier(
+                    inputs,
+                    self.candidate_labels,
+                    multi_label=False,
+                    batch_size=batch_size
+                )
+                to_result = self._zero_shot_result
+            # Some pipeline versions unwrap a one-element batch
+            if isinstance(raw_outputs, dict):
+                raw_outputs = [raw_outputs]
+            outputs = [to_result(output) for output in raw_outputs]
+        except Exception as e:
+            # Fall back to one call per text so a single bad input only fails itself
+            self.logger.warning(f"Batch classification failed, classifying one by one: {e}")
+            outputs = [self.classify(text) for text in inputs]
+        
+        by_text = dict(zip(inputs, outputs))
+        for text, output in by_text.items():
+            if output['label'] != 'error':
+                if len(self._result_cache) >= 4096:
+                    self._result_cache.clear()
+                self._result_cache[text] = output
+        
+        for i, text in pending:
+            results[i] = dict(by_text[text])
+        return results
@@ -1,8 +1,8 @@
 from typing import Dict, Optional, List
 import logging
 import re
-from email.utils import parseaddr, getaddresses
-from .patterns import RegexExtractor
+from email.utils import getaddresses
+from .patterns import get_regex_extractor
 from .nlp_spacy import SpacyNERExtractor
 from .nlp_gliner import GLiNERExtractor
 from .positions import PositionExtractor
@@ -13,6 +13,34 @@ from ..filtering.repository import get_filter_repository
 
 logger = logging.getLogger(__name__)
 
+# Contact fields that may hold free text and need whitespace cleanup
+_CONTACT_STRING_FIELDS = (
+    'name', 'email', 'phone', 'company', 'linkedin_id', 'location',
+    'job_position', 'zip_code', 'employment_type', 'source', 'extraction_source',
+    'recruiter_reason', 'sender_job_title',
+)
+
+# Blank contact copied per extracted address (dict.copy() beats a literal rebuild)
+_CONTACT_TEMPLATE = {
+    'name': None,
+    'email': None,
+    'phone': None,
+    'company': None,
+    'linkedin_id': None,
+    'location': None,
+    'job_position': None,
+    'zip_code': None,
+    'employment_type': None,  # W2, C2C, Contract, etc.
+    'source': None,
+    'extraction_source': None,  # Track where email came from
+}
+
+# Translation table that deletes ASCII digits (length change => digit present)
+_DIGIT_TABLE = str.maketrans('', '', '0123456789')
+
+# Any run of non-letter characters (separators, digits, underscores, symbols)
+_NON_ALPHA_RE = re.compile(r'[\W\d_]+')
+
 class ContactExtractor: 
     """
     Unified contact extraction with config-driven fallback chain
@@ -34,10 +62,21 @@ class ContactExtractor:
         self.skip_keywords = self._load_skip_keywords()
         self.junk_name_patterns = self._load_junk_name_patterns()
         
+        # Compile name rules once: substring lists become a single alternation
+        # regex and city lists a frozenset, so each name check costs one regex
+        # scan or one hash probe regardless of how many CSV rules are loaded
+        self._junk_name_re = self._compile_substring_matcher(self.junk_name_patterns)
+        self._greeting_re = self._compile_substring_matcher(self.greeting_patterns)
+        self._company_indicator_re = self._compile_substring_matcher(self.company_indicators)
+        self._skip_keyword_re = self._compile_substring_matcher(self.skip_keywords)
+        self._city_names = self._load_city_names()
+        
         # Initialize extractors based on config
-        enabled_methods = config.get('extraction', {}).get('enabled_methods', ['regex', 'spacy'])
+        extraction_config = config.get('extraction', {})
+        enabled_methods = frozenset(extraction_config.get('enabled_methods', ('regex', 'spacy')))
+        self._extract_multiple = bool(extraction_config.get('extract_multiple_contacts', True))
         
-        self.regex_extractor = RegexExtractor()
+        self.regex_extractor = get_regex_extractor()
         self.spacy_extractor = None
         self.gliner_extractor = None
         self.position_extractor = None
@@ -130,6 +169,39 @@ class ContactExtractor:
             self.logger.error(f"Failed to load junk_name_patterns from CSV: {str(e)} - using empty list")
             return []
     
+    def _load_city_names(self) -> frozenset:
+        """Load lowercased city names from CSV for person-name rejection"""
+        try:
+            keyword_lists = self.filter_repo.get_keyword_lists()
+            cities = keyword_lists.get('ner_common_cities', []) + keyword_lists.get('us_major_cities', [])
+            return frozenset(c.lower() for c in cities)
+        except Exception as e:
+            self.logger.error(f"Failed to load city names from CSV: {str(e)} - using empty set")
+            return frozenset()
+    
+    @staticmethod
+    def _compile_substring_matcher(keywords: list) -> Optional[re.Pattern]:
+        """Compile a keyword list into one regex equivalent to any(kw in text)"""
+        if not keywords:
+            return None
+        # Longest first so overlapping keywords don't shadow each other
+        ordered = sorted(set(keywords), key=len, reverse=True)
+        return re.compile('|'.join(map(re.escape, ordered)))
+
+    def prefetch_entities(self, clean_bodies: List[str]):
+        """
+        Run GLiNER over a whole fetched batch in batched model calls
+
+        The results land in the extractor's result cache, so the per-email
+        extract_entities() calls made by extract_contacts() are cache hits.
+        """
+        if not self.gliner_extractor or self.gliner_extractor.cache_size <= 0 or not clean_bodies:
+            return
+        try:
+            self.gliner_extractor.extract_entities_batch(clean_bodies)
+        except Exception as e:
+            self.logger.warning(f"GLiNER batch prefetch failed: {str(e)}")
+
     def extract_contacts(self, email_message, clean_body: str, source_email: str, subject: str = None) -> List[Dict]:
         """
         Extract contact information with fallback chain - returns LIST of contacts
@@ -148,7 +220,7 @@ class ContactExtractor:
         
         try:
             # Get configuration settings
-            extract_multiple = self.config.get('extraction', {}).get('extract_multiple_contacts', True)
+            extract_multiple = self._extract_multiple
             block_gmail = self.config.get('extraction', {}).get('block_gmail', True)
             
             # Get raw HTML body for vendor span extraction
@@ -223,19 +295,10 @@ class ContactExtractor:
                     continue  # Skip duplicates
                 seen_emails.add(email_addr)
                 
-                contact = {
-                    'name': None,
-                    'email': email_addr,
-                    'phone': None,
-                    'company': None,
-                    'linkedin_id': None,
-                    'location': None,
-                    'job_position': None,
-                    'zip_code': None,
-                    'employment_type': None,  # NEW: W2, C2C, Contract, etc.
-                    'source': source_email,
-                    'extraction_source': source  # Track where email came from
-                }
+                contact = _CONTACT_TEMPLATE.copy()
+                contact['email'] = email_addr
+                contact['source'] = source_email
+                contact['extraction_source'] = source
 
                 # Extract signature info (Name, Title, Company) for classification
                 signature_info = {}
@@ -249,7 +312,7 @@ class ContactExtractor:
                         gliner_entities = self.gliner_extractor.extract_entities(clean_body)
                         if gliner_entities.get('job_title'):
                             signature_info['title'] = gliner_entities['job_title']
-                            self.logger.debug(f"GLiNER rescued title: {signature_info['title']}")
+                            self.logger.debug("GLiNER rescued title: %s", signature_info['title'])
                         
                         # Also enhance name/company if missing
                         if not signature_info.get('name') and gliner_entities.get('name'):
@@ -274,12 +337,12 @@ class ContactExtractor:
                         candidate_first = source_email.split('@')[0].split('.')[0].split('_')[0].lower()
                         if not (len(candidate_first) >= 3 and sig_labels['name'].lower().startswith(candidate_first)):
                             contact['name'] = sig_labels['name']
-                            self.logger.debug(f"✓ Priority 0 (sig label): {contact['name']}")
+                            self.logger.debug("✓ Priority 0 (sig label): %s", contact['name'])
 
                     # Priority 0 also provides company if not already found
                     if not contact['company'] and sig_labels.get('company'):
                         contact['company'] = sig_labels['company']
-                        self.logger.debug(f"✓ Priority 0 company (sig label): {contact['company']}")
+                        self.logger.debug("✓ Priority 0 company (sig label): %s", contact['company'])
 
                     # PRIORITY 1: Extract name from the specific header that contained this email
                     if not contact['name']:
@@ -333,7 +396,7 @@ class ContactExtractor:
                 if location_from_subject and (location_from_subject.get('location') or location_from_subject.get('zip_code')):
                     contact['location'] = location_from_subject.get('location')
                     contact['zip_code'] = location_from_subject.get('zip_code')
-                    self.logger.debug(f"✓ Extracted location from SUBJECT: {contact['location']}")
+                    self.logger.debug("✓ Extracted location from SUBJECT: %s", contact['location'])
                 else:
                     # Fallback to body extraction
                     # Normalize acronyms in body
@@ -354,7 +417,7 @@ class ContactExtractor:
                 
                 # For encrypted or junk bodies, extract job position from subject
                 if (is_encrypted or is_junk_body) and subject:
-                    self.logger.debug(f"⚠ Body is encrypted/junk - extracting from subject: {subject[:100]}")
+                    self.logger.debug("⚠ Body is encrypted/junk - extracting from subject: %s", subject[:100])
                     
                     # Extract position from subject if not already extracted
                     if not contact['job_position']:
@@ -366,7 +429,7 @@ class ContactExtractor:
                         normalized_subject = self.position_extractor._normalize_acronyms_in_text(subject) if self.position_extractor else subject
                         contact['employment_type'] = self.employment_type_extractor.extract_employment_type_string(normalized_subject)
                         if contact['employment_type']:
-                            self.logger.debug(f"✓ Extracted employment_type from SUBJECT: {contact['employment_type']}")
+                            self.logger.debug("✓ Extracted employment_type from SUBJECT: %s", contact['employment_type'])
                     
                     # CRITICAL FIX: Extract location from subject for encrypted emails (if not already extracted)
                     if not contact['location'] and self.location_extractor:
@@ -376,7 +439,7 @@ class ContactExtractor:
                         if location_data and isinstance(location_data, dict):
                             contact['location'] = location_data.get('location')
                             contact['zip_code'] = location_data.get('zip_code')
-                            self.logger.debug(f"✓ Extracted location from SUBJECT (encrypted): {contact['location']}")
+                            self.logger.debug("✓ Extracted location from SUBJECT (encrypted): %s", contact['location'])
                 
                 # Validate and clean up extracted data
                 if contact['job_position']:
@@ -440,7 +503,7 @@ class ContactExtractor:
                 # Fully dynamic — no hardcoded city list needed.
                 _spacy_nlp = self.spacy_extractor.nlp if self.spacy_extractor else None
                 if contact['company'] and _spacy_nlp:
-                    _company_doc = _spacy_nlp(contact['company'])
+                    _company_doc = _spacy_nlp(contact['company'], disable=self.spacy_extractor.ner_disabled_pipes)
                     _company_labels = {ent.label_ for ent in _company_doc.ents}
                     if _company_labels and _company_labels.issubset({'GPE', 'LOC', 'FAC'}) and 'ORG' not in _company_labels:
                         self.logger.warning(
@@ -485,21 +548,21 @@ class ContactExtractor:
         """Final validation and cleanup of extracted contact"""
         try:
             # Clean up empty strings to None
-            for key in contact:
-                if isinstance(contact[key], str):
-                    cleaned = contact[key].strip()
-                    contact[key] = cleaned if cleaned else None
+            for key in _CONTACT_STRING_FIELDS:
+                value = contact.get(key)
+                if isinstance(value, str):
+                    contact[key] = value.strip() or None
             
             # Validate email format
             if contact['email']:
                 if '@' not in contact['email'] or '.' not in contact['email']:
-                    self.logger.debug(f"Invalid email format: {contact['email']}")
+                    self.logger.debug("Invalid email format: %s", contact['email'])
                     contact['email'] = None
             
             # Validate phone format (should start with +)
             if contact['phone']:
                 if not contact['phone'].startswith('+'):
-                    self.logger.debug(f"Invalid phone format: {contact['phone']}")
+                    self.logger.debug("Invalid phone format: %s", contact['phone'])
                     contact['phone'] = None
             
             # Ensure we have at least email OR linkedin
@@ -513,33 +576,33 @@ class ContactExtractor:
 
                 # Positive gate first: must structurally look like a human name
                 if not self._is_valid_person_name(contact['name']):
-                    self.logger.debug(f"❌ Name fails format gate: {contact['name']}")
+                    self.logger.debug("❌ Name fails format gate: %s", contact['name'])
                     contact['name'] = None
 
                 # Reject names that match known junk patterns from CSV
-                elif any(junk in name_lower for junk in self.junk_name_patterns):
-                    self.logger.debug(f"❌ Name matches junk_name_patterns: {contact['name']}")
+                elif self._junk_name_re and self._junk_name_re.search(name_lower):
+                    self.logger.debug("❌ Name matches junk_name_patterns: %s", contact['name'])
                     contact['name'] = None
 
                 # Reject names that match greeting_patterns or company_indicators
-                elif any(p in name_lower for p in self.greeting_patterns):
-                    self.logger.debug(f"❌ Name matches greeting_patterns: {contact['name']}")
+                elif self._greeting_re and self._greeting_re.search(name_lower):
+                    self.logger.debug("❌ Name matches greeting_patterns: %s", contact['name'])
                     contact['name'] = None
 
-                elif any(p in name_lower for p in self.company_indicators):
-                    self.logger.debug(f"❌ Name matches company_indicators: {contact['name']}")
+                elif self._company_indicator_re and self._company_indicator_re.search(name_lower):
+                    self.logger.debug("❌ Name matches company_indicators: %s", contact['name'])
                     contact['name'] = None
 
                 # Reject city names used as person names
                 elif contact['name'] and self._is_city_name(contact['name']):
-                    self.logger.debug(f"❌ Name is a city name: {contact['name']}")
+                    self.logger.debug("❌ Name is a city name: %s", contact['name'])
                     contact['name'] = None
 
                 # Reject candidate's own first name appearing in greeting
                 elif contact.get('name') and contact.get('source'):
                     candidate_first = contact['source'].split('@')[0].split('.')[0].split('_')[0].lower()
                     if len(candidate_first) >= 3 and contact['name'].lower().startswith(candidate_first):
-                        self.logger.debug(f"❌ Name starts with candidate first name '{candidate_first}': {contact['name']}")
+                        self.logger.debug("❌ Name starts with candidate first name '%s': %s", candidate_first, contact['name'])
                         contact['name'] = None
 
             # ── COMPANY VALIDATION ───────────────────────────────────────────
@@ -549,37 +612,37 @@ class ContactExtractor:
 
                 # Positive structural gate
                 if not self._is_valid_company_name(company):
-                    self.logger.debug(f"❌ Company fails structural gate: {company}")
+                    self.logger.debug("❌ Company fails structural gate: %s", company)
                     contact['company'] = None
 
                 # Reject: phone number embedded in company (e.g. "Desk : 609-998-5909")
                 elif re.search(r':\s*\d{3}', company) or re.search(r'\d{3}[-.\s]\d{3}[-.\s]\d{4}', company):
-                    self.logger.debug(f"❌ Company contains phone number: {company}")
+                    self.logger.debug("❌ Company contains phone number: %s", company)
                     contact['company'] = None
 
                 # Reject: very short abbreviations without suffix (e.g. "Sr", "Sr.", "Mr")
                 elif len(company.rstrip('.')) <= 3 and not any(s in company_lower for s in ['inc', 'llc', 'ltd', 'co']):
-                    self.logger.debug(f"❌ Company too short (abbreviation): {company}")
+                    self.logger.debug("❌ Company too short (abbreviation): %s", company)
                     contact['company'] = None
 
                 # Reject: requisition/job-ID patterns like "AI-25237)" or "(REQ-123)"
                 elif re.search(r'\b[A-Z]{1,4}-\d{3,}\)?$', company):
-                    self.logger.debug(f"❌ Company looks like a requisition ID: {company}")
+                    self.logger.debug("❌ Company looks like a requisition ID: %s", company)
                     contact['company'] = None
 
                 # Reject: meeting platform names
                 elif any(platform in company_lower for platform in ['google meet', 'zoom meeting', 'microsoft teams', 'webex', 'go to meeting']):
-                    self.logger.debug(f"❌ Company is a meeting platform: {company}")
+                    self.logger.debug("❌ Company is a meeting platform: %s", company)
                     contact['company'] = None
 
                 # Reject: day-of-week strings (Google Calendar invite fragments)
                 elif re.search(r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b', company_lower):
-                    self.logger.debug(f"❌ Company contains day-of-week (calendar fragment): {company}")
+                    self.logger.debug("❌ Company contains day-of-week (calendar fragment): %s", company)
                     contact['company'] = None
 
                 # Reject: contains unicode bullets common in calendar invites
                 elif '⋅' in company or '•' in company:
-                    self.logger.debug(f"❌ Company contains calendar bullet character: {company}")
+                    self.logger.debug("❌ Company contains calendar bullet character: %s", company)
                     contact['company'] = None
 
             # ── LOCATION VALIDATION ──────────────────────────────────────────
@@ -590,22 +653,22 @@ class ContactExtractor:
                 # Reject: meeting platforms / video call links
                 meeting_platforms = ['google meet', 'zoom', 'microsoft teams', 'webex', 'teams meeting', 'go to meeting', 'gotomeeting']
                 if any(p in location_lower for p in meeting_platforms):
-                    self.logger.debug(f"❌ Location is a meeting platform: {location}")
+                    self.logger.debug("❌ Location is a meeting platform: %s", location)
                     contact['location'] = None
 
                 # Reject: timezone strings like "America/New_York"
                 elif re.match(r'^America/', location, re.IGNORECASE) or re.match(r'^(UTC|GMT)[+-]?\d*$', location, re.IGNORECASE):
-                    self.logger.debug(f"❌ Location is a timezone string: {location}")
+                    self.logger.debug("❌ Location is a timezone string: %s", location)
                     contact['location'] = None
 
                 # Reject: bare country/tech junk (standalone)
                 elif location_lower in {'us', 'usa', 'ai', 'ml', 'gemini', 'w2', 'c2c', '1099'}:
-                    self.logger.debug(f"❌ Location is a bare junk term: {location}")
+                    self.logger.debug("❌ Location is a bare junk term: %s", location)
                     contact['location'] = None
 
                 # Reject: garbled text containing '@' or HTML-like fragments
                 elif '@' in location or re.search(r'<[^>]+>', location):
-                    self.logger.debug(f"❌ Location contains email/HTML fragment: {location}")
+                    self.logger.debug("❌ Location contains email/HTML fragment: %s", location)
                     contact['location'] = None
 
             # ── DATA QUALITY SCORE ───────────────────────────────────────────
@@ -618,18 +681,7 @@ class ContactExtractor:
 
     def _is_city_name(self, name: str) -> bool:
         """Check if a name is actually a well-known city (should not be a person name)"""
-        try:
-            keyword_lists = self.filter_repo.get_keyword_lists()
-            common_cities = keyword_lists.get('ner_common_cities', [])
-            name_lower = name.lower().strip()
-            if name_lower in [c.lower() for c in common_cities]:
-                return True
-            major_cities = keyword_lists.get('us_major_cities', [])
-            if name_lower in [c.lower() for c in major_cities]:
-                return True
-        except Exception:
-            pass
-        return False
+        return name.lower().strip() in self._city_names
 
     def _is_valid_person_name(self, name: str) -> bool:
         """
@@ -652,7 +704,7 @@ class ContactExtractor:
             if not clean[0].isupper():
                 return False
             # No digits (names don't have numbers)
-            if any(c.isdigit() for c in clean):
+            if len(clean.translate(_DIGIT_TABLE)) != len(clean):
                 return False
             # Must be mostly alpha
             if not clean.isalpha():
@@ -703,7 +755,7 @@ class ContactExtractor:
                 value = m.group(1).strip()
                 if value:
                     result[field] = value
-                    self.logger.debug(f"✓ Signature label extracted {field}: {value}")
+                    self.logger.debug("✓ Signature label extracted %s: %s", field, value)
 
         return result
 
@@ -816,7 +868,7 @@ class ContactExtractor:
                     continue
                 
                 if value:
-                    self.logger.debug(f"Extracted {field} using {method}: {value}")
+                    self.logger.debug("Extracted %s using %s: %s", field, method, value)
                     return value
                     
             except Exception as e:
@@ -871,7 +923,7 @@ class ContactExtractor:
             )
             
             if company:
-                self.logger.debug(f"✓ Extracted company using scoring: {company}")
+                self.logger.debug("✓ Extracted company using scoring: %s", company)
             
             return company
         
@@ -914,20 +966,20 @@ class ContactExtractor:
             # Try regex first (fast and accurate for common patterns)
             position = self.position_extractor.extract_job_position_regex(text)
             if position:
-                self.logger.debug(f"✓ Extracted position (regex): {position}")
+                self.logger.debug("✓ Extracted position (regex): %s", position)
                 return position
             
             # Try subject line if available
             if subject:
                 position = self.position_extractor.extract_job_position_regex(subject)
                 if position:
-                    self.logger.debug(f"✓ Extracted position from subject (regex): {position}")
+                    self.logger.debug("✓ Extracted position from subject (regex): %s", position)
                     return position
             
             # Try spacy noun phrase extraction
             position = self.position_extractor.extract_job_position_spacy(text)
             if position:
-                self.logger.debug(f"✓ Extracted position (spacy): {position}")
+                self.logger.debug("✓ Extracted position (spacy): %s", position)
                 return position
             
             return None
@@ -960,18 +1012,15 @@ class ContactExtractor:
             # Get part before @
             local_part = email.split('@')[0]
             
-            # Replace common separators with space
-            name = local_part.replace('.', ' ').replace('_', ' ').replace('-', ' ')
-            
-            # Remove numbers and special chars
-            name = ''.join(char if char.isalpha() or char.isspace() else ' ' for char in name)
+            # Replace separators, numbers and special chars with space in one pass
+            name = _NON_ALPHA_RE.sub(' ', local_part)
             
             # Title case each word
             name = ' '.join(word.capitalize() for word in name.split() if len(word) > 1)
             
             # Only return if we got a reasonable name (2+ words or 1 word with 3+ chars)
             if len(name.split()) >= 2 or len(name) >= 3:
-                self.logger.debug(f"Extracted name from email: {name}")
+                self.logger.debug("Extracted name from email: %s", name)
                 return name
             
         except Exception as e:
@@ -997,7 +1046,7 @@ class ContactExtractor:
 
             # Check if domain is blocked (gmail, yahoo, etc.) using filter_repo
             if self.filter_repo.check_email(email) == 'block':
-                self.logger.debug(f"✗ Blocked personal domain for company extraction: {domain}")
+                self.logger.debug("✗ Blocked personal domain for company extraction: %s", domain)
                 return None
 
             # Remove TLD (.com, .co, .org, .net, etc.)
@@ -1008,7 +1057,7 @@ class ContactExtractor:
             # Real company domains worth carrying are usually 5+ characters.
             if len(company_name) <= 4:
                 self.logger.debug(
-                    f"✗ Domain-derived company too short to use as name: '{company_name}' (from {email})"
+                    "✗ Domain-derived company too short to use as name: '%s' (from %s)", company_name, email
                 )
                 return None
 
@@ -1022,14 +1071,14 @@ class ContactExtractor:
             }
             if company_name.lower() in _domain_junk:
                 self.logger.debug(
-                    f"✗ Domain-derived company is a known ATS/platform: '{company_name}' (from {email})"
+                    "✗ Domain-derived company is a known ATS/platform: '%s' (from %s)", company_name, email
                 )
                 return None
 
             # Capitalize first letter
             company_name = company_name.capitalize()
 
-            self.logger.debug(f"✓ Extracted company from email domain: {company_name} (from {email})")
+            self.logger.debug("✓ Extracted company from email domain: %s (from %s)", company_name, email)
             return company_name
 
         except Exception as e:
@@ -1047,13 +1096,12 @@ class ContactExtractor:
         name_lower = name.lower().strip()
         
         # Filter common greetings and invalid patterns (loaded from CSV)
-        for pattern in self.greeting_patterns:
-            if pattern in name_lower or name_lower.startswith(pattern):
-                self.logger.info(f"✗ Rejected greeting/generic name: {name}")
-                return True
+        if self._greeting_re and self._greeting_re.search(name_lower):
+            self.logger.info(f"✗ Rejected greeting/generic name: {name}")
+            return True
         
         # Reject if name looks like a company/team name (loaded from CSV)
-        if any(indicator in name_lower for indicator in self.company_indicators):
+        if self._company_indicator_re and self._company_indicator_re.search(name_lower):
             self.logger.info(f"✗ Rejected company/team name: {name}")
             return True
         
@@ -1119,49 +1167,6 @@ class ContactExtractor:
         
         return True
     
-    def _extract_from_cc_headers(self, email_message) -> Optional[str]:
-        """Extract recruiter email from TO/CC/Reply-To headers"""
-        try:
-            all_emails = set()
-            
-            # Check TO header (multiple recipients)
-            to_header = email_message.get('To', '')
-            if to_header:
-                for addr in to_header.split(','):
-                    _, email_addr = parseaddr(addr.strip())
-                    if email_addr and '@' in email_addr:
-                        email_lower = email_addr.lower()
-                        if self._is_valid_header_email(email_lower):
-                            all_emails.add(email_lower)
-            
-            # Check CC header
-            cc_header = email_message.get('Cc', '')
-            if cc_header:
-                for addr in cc_header.split(','):
-                    _, email_addr = parseaddr(addr.strip())
-                    if email_addr and '@' in email_addr:
-                        email_lower = email_addr.lower()
-                        if self._is_valid_header_email(email_lower):
-                            all_emails.add(email_lower)
-            
-            # Check Reply-To (often recruiter's direct email - HIGHEST PRIORITY)
-            reply_to = email_message.get('Reply-To', '')
-            if reply_to:
-                _, email_addr = parseaddr(reply_to)
-                if email_addr and '@' in email_addr:
-                    email_lower = email_addr.lower()
-                    if self._is_valid_header_email(email_lower):
-                        # Prioritize Reply-To
-                        return email_lower
-            
-            # Return first valid email
-            return list(all_emails)[0] if all_emails else None
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting header emails: {str(e)}")
-            return None
-    
-    
     def _is_gmail_address(self, email: str, block_gmail: bool = True) -> bool:
         """Check if email is from Gmail or other personal domains using database filters"""
         if not block_gmail:
@@ -1172,7 +1177,7 @@ class ContactExtractor:
         
         action = self.filter_repo.check_email(email)
         if action == 'block':
-            self.logger.debug(f"✗ Blocked personal email domain: {email}")
+            self.logger.debug("✗ Blocked personal email domain: %s", email)
             return True
         
         return False
@@ -1188,7 +1193,7 @@ class ContactExtractor:
                         email_lower = email_addr.lower()
                         if self._is_valid_header_email(email_lower):
                             emails.append(email_lower)
-                            self.logger.debug(f"✓ Extracted Reply-To: {email_lower}")
+                            self.logger.debug("✓ Extracted Reply-To: %s", email_lower)
         except Exception as e:
             self.logger.error(f"Error extracting Reply-To: {str(e)}")
         return emails
@@ -1204,7 +1209,7 @@ class ContactExtractor:
                         email_lower = email_addr.lower()
                         if self._is_valid_header_email(email_lower):
                             emails.append(email_lower)
-                            self.logger.debug(f"✓ Extracted Sender: {email_lower}")
+                            self.logger.debug("✓ Extracted Sender: %s", email_lower)
         except Exception as e:
             self.logger.error(f"Error extracting Sender: {str(e)}")
         return emails
@@ -1220,7 +1225,7 @@ class ContactExtractor:
                         email_lower = email_addr.lower()
                         if self._is_valid_header_email(email_lower):
                             emails.append(email_lower)
-                            self.logger.debug(f"✓ Extracted From: {email_lower}")
+                            self.logger.debug("✓ Extracted From: %s", email_lower)
         except Exception as e:
             self.logger.error(f"Error extracting From: {str(e)}")
         return emails
@@ -1236,7 +1241,7 @@ class ContactExtractor:
                         email_lower = email_addr.lower()
                         if self._is_valid_header_email(email_lower):
                             emails.append(email_lower)
-                            self.logger.debug(f"✓ Extracted To: {email_lower}")
+                            self.logger.debug("✓ Extracted To: %s", email_lower)
         
         except Exception as e:
             self.logger.error(f"Error extracting To: {str(e)}")
@@ -1255,7 +1260,7 @@ class ContactExtractor:
                         email_lower = email_addr.lower()
                         if self._is_valid_header_email(email_lower):
                             emails.append(email_lower)
-                            self.logger.debug(f"✓ Extracted CC: {email_lower}")
+                            self.logger.debug("✓ Extracted CC: %s", email_lower)
             
             # Check BCC header (rarely present in received emails, but check anyway)
             bcc_header = email_message.get('Bcc', '')
@@ -1265,17 +1270,29 @@ class ContactExtractor:
                         email_lower = email_addr.lower()
                         if self._is_valid_header_email(email_lower):
                             emails.append(email_lower)
-                            self.logger.debug(f"✓ Extracted BCC: {email_lower}")
+                            self.logger.debug("✓ Extracted BCC: %s", email_lower)
         
         except Exception as e:
             self.logger.error(f"Error extracting CC/BCC: {str(e)}")
         
         return emails
     
+    @staticmethod
+    def _is_plausible_email(email: str) -> bool:
+        """Cheap structural check run before any filter-repository lookup"""
+        # RFC 5321 caps addresses at 254 chars; require one '@' and a dotted domain
+        if not email or len(email) > 254 or email.count('@') != 1:
+            return False
+        return '.' in email.rsplit('@', 1)[1]
+    
     def _is_valid_header_email(self, email: str) -> bool:
         """Check if header email is valid recruiter email (not automated/system)"""
-        # Skip automated/system emails (loaded from CSV)
-        if any(kw in email for kw in self.skip_keywords):
+        # Reject malformed addresses before keyword/filter checks
+        if not self._is_plausible_email(email):
+            return False
+        
+        # Skip automated/system emails (loaded from CSV, e.g. noreply/no-reply)
+        if self._skip_keyword_re and self._skip_keyword_re.search(email):
             return False
         
         # Note: Personal domains (Gmail, Yahoo, etc.) are filtered by _is_gmail_address
@@ -1312,7 +1329,7 @@ class ContactExtractor:
                 for name, addr in getaddresses([header_value]):
                     if addr and addr.lower() == email_lower:
                         if name and name != addr:
-                            self.logger.debug(f"✓ Extracted name from {header_name}: {name}")
+                            self.logger.debug("✓ Extracted name from %s: %s", header_name, name)
                             return name.strip()
         
         except Exception as e:
@@ -1349,15 +1366,25 @@ class ContactExtractor:
             if email_message.is_multipart():
                 for part in email_message.walk():
                     if part.get_content_type() == "text/calendar":
-                        payload = part.get_payload(decode=True).decode("utf-8", errors="ignore")
+                        raw_payload = part.get_payload(decode=True)
+                        if not raw_payload:
+                            continue
+                        # Honour the part's declared charset; unknown charsets fall back to UTF-8
+                        charset = part.get_content_charset() or 'utf-8'
+                        try:
+                            payload = raw_payload.decode(charset, errors='replace')
+                        except LookupError:
+                            payload = raw_payload.decode('utf-8', errors='replace')
                         
                         # Extract ORGANIZER
                         for match in re.findall(r"ORGANIZER.*mailto:([^ \r\n]+)", payload, re.IGNORECASE):
-                            emails.add(match.lower())
+                            if self._is_plausible_email(match):
+                                emails.add(match.lower())
                         
                         # Extract ATTENDEE
                         for match in re.findall(r"ATTENDEE.*mailto:([^ \r\n]+)", payload, re.IGNORECASE):
-                            emails.add(match.lower())
+                            if self._is_plausible_email(match):
+                                emails.add(match.lower())
             
             
             return list(emails) if emails else None
@@ -19,7 +19,7 @@ class EmploymentTypeExtractor:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        from src.extractor.filtering.repository import get_filter_repository
+        from src.extractor.filtering.repository import get_filter_repository, compile_pattern_union
         self.filter_repo = get_filter_repository()
         
         # Load patterns from CSV
@@ -28,10 +28,10 @@ class EmploymentTypeExtractor:
         # Compile all patterns for efficiency
         self.compiled_patterns = {}
         for emp_type, patterns in self.employment_patterns.items():
-            self.compiled_patterns[emp_type] = [
-                re.compile(pattern, re.IGNORECASE) for pattern in patterns
-            ]
-            
+            # A type is found when any of its patterns matches, so fuse them
+            # (grouped and inline-flag patterns stay separate)
+            self.compiled_patterns[emp_type] = compile_pattern_union(patterns, engine=re)
+    
     def _load_employment_filters(self) -> dict:
         """Load employment patterns from filter repository (CSV)"""
         try:
@@ -84,7 +84,7 @@ class EmploymentTypeExtractor:
             result = sorted(list(found_types))
             
             if result:
-                self.logger.debug(f"✓ Extracted employment types: {result}")
+                self.logger.debug("✓ Extracted employment types: %s", result)
             
             return result
             
@@ -1,23 +1,91 @@
 import logging
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List
 from src.extractor.filtering.repository import get_filter_repository
 
 logger = logging.getLogger(__name__)
 
+# Per-field minimum confidence thresholds
+# Location is highest because it's easily confused with company names
+FIELD_THRESHOLDS = {
+    'name':      0.55,
+    'company':   0.50,
+    'location':  0.65,
+    'job_title': 0.40,
+}
+
+# Label substrings that map a GLiNER label to an output field (checked in order)
+_LABEL_FIELD_KEYS = (
+    ('name', ('person', 'full name', 'recruiter')),
+    ('company', ('company', 'organization', 'employer')),
+    ('location', ('location', 'city', 'address')),
+    ('job_title', ('job title', 'position', 'role')),
+)
+
+# Common sign-off markers that start an email signature block
+_SIGNATURE_MARKER_RE = re.compile(
+    r'best regards|warm regards|regards|thank you|thanks|sincerely|cheers',
+    re.IGNORECASE
+)
+
+# Signatures sit at the end of the body - only this many trailing chars are scanned
+_SIGNATURE_SCAN_WINDOW = 4096
+
+# Upper bound on text handed to the model when no signature section is found.
+# ~800 chars stays inside the backbone's 384-token window; attention cost is O(L^2)
+_MAX_EXTRACTION_CHARS = 800
+
+# Joins packed texts; entities spanning it are dropped when splitting results
+_PACK_SEPARATOR = '\n\n'
+
+# Any digit - name/location spans containing one are rejected
+_DIGIT_RE = re.compile(r'\d')
+
+# Punctuation stripped before location lookups
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# Placeholder company words that are never real employers
+_GENERIC_COMPANY_WORDS = frozenset({'company', 'organization', 'firm', 'team'})
+
 class GLiNERExtractor:
     """
     Extract entities using GLiNER - zero-shot NER model
     More flexible and accurate than traditional BERT-based models
     """
     
+    # Fixed attribute layout - avoids a per-instance __dict__ on the hot path
+    __slots__ = (
+        'threshold', 'batch_size', 'cache_size', 'entity_labels',
+        'pack_sequences', 'pack_max_chars', 'model', 'label_embeddings', 'filter_repo',
+        'location_indicators', 'common_cities', 'company_suffixes', 'generic_company_terms',
+        '_short_location_indicators', '_long_location_re', '_result_cache', '_cache_lock', '_label_fields',
+    )
+    
     def __init__(self, config: dict):
-        self.logger = logging.getLogger(__name__)
-        
         # Load config
         gliner_config = config.get('gliner', {})
-        model_name = gliner_config.get('model', 'urchade/gliner_base')
+        # Bi-encoder checkpoint: labels are encoded separately from the text,
+        # so their embeddings can be computed once and reused for every email
+        model_name = gliner_config.get('model', 'knowledgator/gliner-bi-base-v1.0')
         self.threshold = gliner_config.get('threshold', 0.6)  # Higher threshold for better accuracy
+        self.batch_size = gliner_config.get('batch_size', 32)
+        
+        # Optional sequence packing: several short texts share one model input
+        self.pack_sequences = gliner_config.get('pack_sequences', False)
+        self.pack_max_chars = gliner_config.get('pack_max_chars', 1500)
+        
+        # LRU of parsed results keyed by extraction text - repeated bodies and
+        # forwarded signature blocks skip the model entirely. Candidate inboxes
+        # run on a thread pool, so LRU reordering/eviction happens under a lock
+        self.cache_size = gliner_config.get('cache_size', 1024)
+        self._result_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # GLiNER label -> output field, resolved once per distinct label
+        self._label_fields = {}
         self.entity_labels = gliner_config.get('entity_labels', [
             'person name', 'full name', 'recruiter name',
             'company name', 'organization', 'employer',
@@ -27,12 +95,13 @@ class GLiNERExtractor:
         ])
         
         try:
-            from gliner import GLiNER
-            self.model = GLiNER.from_pretrained(model_name)
-            self.logger.info(f"GLiNER model loaded: {model_name}")
+            self.model = self._load_model(model_name, gliner_config)
         except Exception as e:
-            self.logger.error(f"Failed to load GLiNER: {str(e)}")
+            logger.error("Failed to load GLiNER: %s", e)
             raise
+        
+        # Entity labels are fixed by config - encode them once up front
+        self.label_embeddings = self._encode_labels()
             
         # Load filter repository
         self.filter_repo = get_filter_repository()
@@ -46,13 +115,167 @@ class GLiNERExtractor:
             self.common_cities = {kw.lower().strip() for kw in keyword_lists.get('ner_common_cities', [])}
             self.company_suffixes = {kw.lower().strip() for kw in keyword_lists.get('ner_company_suffixes', [])}
             self.generic_company_terms = {kw.lower().strip() for kw in keyword_lists.get('generic_company_terms', [])}
-            self.logger.info(f"✓ GLiNER loaded {len(self.location_indicators)} location indicators, {len(self.common_cities)} cities from CSV")
+            self.generic_company_terms |= _GENERIC_COMPANY_WORDS
+            self._compile_location_indicators()
+            logger.info("✓ GLiNER loaded %d location indicators, %d cities from CSV", len(self.location_indicators), len(self.common_cities))
         except Exception as e:
-            self.logger.error(f"Error loading GLiNER filters: {str(e)}")
+            logger.error("Error loading GLiNER filters: %s", e)
             self.location_indicators = set()
             self.common_cities = set()
             self.company_suffixes = set()
-            self.generic_company_terms = set()
+            self.generic_company_terms = set(_GENERIC_COMPANY_WORDS)
+            self._compile_location_indicators()
+    
+    def _compile_location_indicators(self):
+        """Split location indicators into a whole-word set (<= 3 chars) and one substring regex"""
+        self._short_location_indicators = frozenset(
+            indicator for indicator in self.location_indicators if len(indicator) <= 3
+        )
+        long_indicators = sorted(
+            (indicator for indicator in self.location_indicators if len(indicator) > 3),
+            key=len, reverse=True
+        )
+        self._long_location_re = (
+            re.compile('|'.join(re.escape(indicator) for indicator in long_indicators))
+            if long_indicators else None
+        )
+    
+    def _load_model(self, model_name: str, gliner_config: dict):
+        """Load GLiNER with the PyTorch backend, or ONNX Runtime when `gliner.onnx` is enabled"""
+        from gliner import GLiNER
+        
+        onnx_config = gliner_config.get('onnx', {})
+        if not onnx_config.get('enabled', False):
+            model = GLiNER.from_pretrained(model_name)
+            logger.info("GLiNER model loaded: %s", model_name)
+            return model
+        
+        import onnxruntime as ort
+        
+        # GPU: fused FP16 graph on CUDA. CPU: INT8 quantized graph (half the bytes, VNNI dot products)
+        use_gpu = ort.get_device() == 'GPU'
+        if use_gpu:
+            onnx_file = onnx_config.get('gpu_model_file', 'model_fp16.onnx')
+        else:
+            onnx_file = onnx_config.get('cpu_model_file', 'model_quantized.onnx')
+        
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session_options.intra_op_num_threads = onnx_config.get('intra_op_num_threads', 4)
+        
+        model = GLiNER.from_pretrained(
+            model_name,
+            load_onnx_model=True,
+            load_tokenizer=True,
+            onnx_model_file=onnx_file,
+            session_options=session_options,
+            map_location='cuda' if use_gpu else 'cpu'
+        )
+        logger.info("GLiNER ONNX model loaded: %s/%s (%s)", model_name, onnx_file, 'GPU' if use_gpu else 'CPU')
+        return model
+    
+    def _encode_labels(self):
+        """Pre-compute label embeddings for bi-encoder models (None for uni-encoders)"""
+        if not hasattr(self.model, 'encode_labels'):
+            return None
+        try:
+            embeddings = self.model.encode_labels(self.entity_labels)
+            logger.info("✓ GLiNER cached embeddings for %d entity labels", len(self.entity_labels))
+            return embeddings
+        except Exception as e:
+            # Uni-encoder checkpoints expose the method but cannot encode labels alone
+            logger.info("GLiNER label embeddings unavailable, encoding labels per call: %s", e)
+            return None
+    
+    def _predict_batch(self, texts: List[str]) -> List[List[Dict]]:
+        """Run the model on many texts at once, reusing cached label embeddings when available"""
+        if self.label_embeddings is not None:
+            return self.model.batch_predict_with_embeds(
+                texts,
+                self.label_embeddings,
+                self.entity_labels,
+                threshold=self.threshold,
+                flat_ner=True,
+                batch_size=self.batch_size
+            )
+        
+        return self.model.batch_predict_entities(
+            texts, 
+            self.entity_labels,
+            threshold=self.threshold,
+            flat_ner=True,  # Better for overlapping entities
+            batch_size=self.batch_size
+        )
+    
+    def _predict_chunk(self, chunk: List[tuple]) -> List[List[Dict]]:
+        """Run the model on a chunk of (index, extraction text) pairs"""
+        texts = [extraction_text for _, extraction_text in chunk]
+        if self.pack_sequences:
+            return self._predict_packed(texts)
+        return self._predict_batch(texts)
+    
+    def _predict_packed(self, texts: List[str]) -> List[List[Dict]]:
+        """
+        Pack short texts into shared model inputs, then split entities back per text
+        
+        Texts are sorted by length and packed next-fit up to pack_max_chars (a
+        full pack is closed and never revisited), so packs hold texts of
+        similar length and padding inside a batch is minimal. Entities are assigned to their owning
+        text by character offset; spans crossing a separator are discarded.
+        """
+        sep_len = len(_PACK_SEPARATOR)
+        packs = []  # each pack: list of (text index, start offset, end offset)
+        current, length = [], 0
+        for i in sorted(range(len(texts)), key=lambda i: len(texts[i])):
+            size = len(texts[i])
+            if current and length + sep_len + size > self.pack_max_chars:
+                packs.append(current)
+                current, length = [], 0
+            start = length + sep_len if current else 0
+            current.append((i, start, start + size))
+            length = start + size
+        if current:
+            packs.append(current)
+        
+        packed_texts = [_PACK_SEPARATOR.join(texts[i] for i, _, _ in pack) for pack in packs]
+        
+        results = [[] for _ in texts]
+        for pack, entities_raw in zip(packs, self._predict_batch(packed_texts)):
+            for entity in entities_raw:
+                for i, start, end in pack:
+                    if start <= entity['start'] and entity['end'] <= end:
+                        results[i].append(entity)
+                        break
+        
+        return results
+    
+    def _get_extraction_text(self, text: str) -> str:
+        """Pick the text to run the model on: signature section, else the trailing 800 chars"""
+        # Extract signature section (most reliable for contact info)
+        signature_text = self._extract_signature_section(text)
+        
+        # Use signature if available, otherwise use full text
+        # Signatures live at the tail, so the fallback keeps the end of the body
+        return signature_text if signature_text else text[-_MAX_EXTRACTION_CHARS:]
+    
+    def _cache_get(self, extraction_text: str) -> Optional[Dict[str, str]]:
+        """Return a copy of the cached result for this text (None on miss)"""
+        with self._cache_lock:
+            cached = self._result_cache.get(extraction_text)
+            if cached is None:
+                return None
+            self._result_cache.move_to_end(extraction_text)
+        return dict(cached)
+    
+    def _cache_put(self, extraction_text: str, entities: Dict[str, str]):
+        """Store a parsed result, evicting the least recently used entry when full"""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._result_cache[extraction_text] = dict(entities)
+            self._result_cache.move_to_end(extraction_text)
+            if len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
     
     def extract_entities(self, text: str) -> Dict[str, str]:
         """
@@ -68,25 +291,22 @@ class GLiNERExtractor:
             if not text or len(text.strip()) < 20:
                 return {'name': None, 'company': None, 'location': None, 'job_title': None}
             
-            # Extract signature section (most reliable for contact info)
-            signature_text = self._extract_signature_section(text)
+            extraction_text = self._get_extraction_text(text)
             
-            # Use signature if available, otherwise use full text
-            extraction_text = signature_text if signature_text else text[:2000]
+            cached = self._cache_get(extraction_text)
+            if cached is not None:
+                return cached
             
             # Extract entities
-            entities_raw = self.model.predict_entities(
-                extraction_text, 
-                self.entity_labels,
-                threshold=self.threshold,
-                flat_ner=True  # Better for overlapping entities
-            )
+            entities_raw = self._predict_batch([extraction_text])[0]
             
             # Parse results
-            return self._parse_entities(entities_raw)
+            entities = self._parse_entities(entities_raw)
+            self._cache_put(extraction_text, entities)
+            return entities
             
         except Exception as e:
-            self.logger.error(f"GLiNER extraction error: {str(e)}")
+            logger.error("GLiNER extraction error: %s", e)
             return {
                 'name': None, 
                 'company': None, 
@@ -94,23 +314,74 @@ class GLiNERExtractor:
                 'job_title': None
             }
     
+    def extract_entities_batch(self, texts: List[str]) -> List[Dict[str, str]]:
+        """
+        Extract contact entities from many emails with batched model calls
+        
+        Args:
+            texts: Texts to extract from
+            
+        Returns:
+            One dictionary per input text (same order), keys as in extract_entities
+        """
+        results = [
+            {'name': None, 'company': None, 'location': None, 'job_title': None}
+            for _ in texts
+        ]
+        
+        # Short/empty texts keep the empty placeholder at their index
+        indices = [i for i, text in enumerate(texts) if text and len(text.strip()) >= 20]
+        if not indices:
+            return results
+        
+        try:
+            # Serve cache hits directly; only misses go to the model
+            pending = []
+            for i in indices:
+                extraction_text = self._get_extraction_text(texts[i])
+                cached = self._cache_get(extraction_text)
+                if cached is not None:
+                    results[i] = cached
+                else:
+                    pending.append((i, extraction_text))
+            
+            chunks = [pending[n:n + self.batch_size] for n in range(0, len(pending), self.batch_size)]
+            if len(chunks) == 1:
+                # Nothing to overlap with - run inline without a worker thread
+                for (i, extraction_text), entities_raw in zip(chunks[0], self._predict_chunk(chunks[0])):
+                    results[i] = self._parse_entities(entities_raw)
+                    self._cache_put(extraction_text, results[i])
+            elif chunks:
+                # Two-stage pipeline: the model runs chunk n+1 in a worker thread
+                # (torch/ORT release the GIL) while chunk n is parsed here
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(self._predict_chunk, chunks[0])
+                    for n, chunk in enumerate(chunks):
+                        batch_raw = future.result()
+                        if n + 1 < len(chunks):
+                            future = executor.submit(self._predict_chunk, chunks[n + 1])
+                        
+                        for (i, extraction_text), entities_raw in zip(chunk, batch_raw):
+                            results[i] = self._parse_entities(entities_raw)
+                            self._cache_put(extraction_text, results[i])
+        except Exception as e:
+            logger.error("GLiNER batch extraction error: %s", e)
+        
+        return results
+    
     def _is_location(self, text: str) -> bool:
         """Check if text looks like a location (city, state, country) rather than a company name"""
         if not text:
             return False
         
         text_lower = text.lower().strip()
-        text_clean = re.sub(r'[^\w\s]', '', text_lower)  # Remove punctuation
+        text_clean = _PUNCT_RE.sub('', text_lower)  # Remove punctuation
         
         # Check text words against location indicators (exact match for short ones)
-        text_words = set(text_clean.split())
-        for indicator in self.location_indicators:
-            if len(indicator) <= 3:
-                if indicator in text_words:
-                    return True
-            else:
-                if indicator in text_clean:
-                    return True
+        if not self._short_location_indicators.isdisjoint(text_clean.split()):
+            return True
+        if self._long_location_re and self._long_location_re.search(text_clean):
+            return True
         
         # Check if it's a common city name
         if text_clean in self.common_cities:
@@ -119,26 +390,41 @@ class GLiNERExtractor:
         return False
     
     def _extract_signature_section(self, text: str) -> str:
-        """Extract signature section from email (last 500 chars usually)"""
+        """Extract signature section from email ('' when no sign-off marker is found)"""
         try:
-            # Look for common signature indicators
-            signature_markers = [
-                'Best regards', 'Best Regards', 'Regards', 'Thanks', 
-                'Thank you', 'Sincerely', 'Warm regards', 'Cheers'
-            ]
+            # Look for the last sign-off marker in a single regex pass over the tail
+            tail = text[-_SIGNATURE_SCAN_WINDOW:]
+            last_match = None
+            for last_match in _SIGNATURE_MARKER_RE.finditer(tail):
+                pass
             
-            text_lower = text.lower()
-            for marker in signature_markers:
-                pos = text_lower.rfind(marker.lower())
-                if pos != -1:
-                    # Get text from marker onwards (up to 500 chars)
-                    return text[pos:pos+500]
+            if last_match:
+                # Get text from marker onwards (up to 500 chars)
+                pos = last_match.start()
+                return tail[pos:pos+500]
             
-            # Fallback: last 500 chars
-            return text[-500:] if len(text) > 500 else text
+            # No marker - the caller falls back to the tail of the body
+            return ''
             
-        except:
-            return text[:2000]
+        except Exception:
+            return ''
+    
+    def _field_for_label(self, label: str) -> Optional[str]:
+        """Map a GLiNER label to its output field (memoized - labels come from a fixed set)"""
+        try:
+            return self._label_fields[label]
+        except KeyError:
+            pass
+        
+        label_lower = label.lower()
+        field = None
+        for candidate, keys in _LABEL_FIELD_KEYS:
+            if any(key in label_lower for key in keys):
+                field = candidate
+                break
+        
+        self._label_fields[label] = field
+        return field
     
     def _parse_entities(self, entities_raw: List[Dict]) -> Dict[str, str]:
         """Parse GLiNER output to standardized format with per-field confidence thresholds"""
@@ -149,25 +435,10 @@ class GLiNERExtractor:
             'job_title': None
         }
 
-        # Per-field minimum confidence thresholds
-        # Location is highest because it's easily confused with company names
-        FIELD_THRESHOLDS = {
-            'name':      0.55,
-            'company':   0.50,
-            'location':  0.65,
-            'job_title': 0.40,
-        }
-
-        # Group by label type with scores
-        candidates = {
-            'name': [],
-            'company': [],
-            'location': [],
-            'job_title': []
-        }
+        # Running best score per field - only the top candidate is kept
+        best_scores = {}
 
         for entity in entities_raw:
-            label = entity['label'].lower()
             text = entity['text'].strip()
             score = entity.get('score', 0)
 
@@ -180,50 +451,40 @@ class GLiNERExtractor:
                 continue
 
             # Categorize entities
-            if 'person' in label or 'full name' in label or 'recruiter' in label:
-                field = 'name'
-                if score < FIELD_THRESHOLDS[field]:
-                    self.logger.debug(f"GLiNER: Skipping low-confidence name ({score:.2f}): {text}")
-                    continue
+            field = self._field_for_label(entity['label'])
+            if field is None:
+                continue
+
+            if score < FIELD_THRESHOLDS[field]:
+                logger.debug("GLiNER: Skipping low-confidence %s (%.2f): %s", field, score, text)
+                continue
+
+            # Cannot beat the current best (ties keep the earlier entity) - skip validation
+            if field in best_scores and score <= best_scores[field]:
+                continue
+
+            if field == 'name':
                 words = text.split()
                 # Valid names: 2-4 words, no numbers
-                if 2 <= len(words) <= 4 and not any(char.isdigit() for char in text):
-                    candidates['name'].append((text, score))
-
-            elif 'company' in label or 'organization' in label or 'employer' in label:
-                field = 'company'
-                if score < FIELD_THRESHOLDS[field]:
-                    self.logger.debug(f"GLiNER: Skipping low-confidence company ({score:.2f}): {text}")
+                if not 2 <= len(words) <= 4 or _DIGIT_RE.search(text):
                     continue
+
+            elif field == 'company':
                 # Skip generic company terms
-                if text.lower() not in self.generic_company_terms and text.lower() not in ['company', 'organization', 'firm', 'team']:
-                    # CRITICAL: Check if it's actually a location before adding as company
-                    if not self._is_location(text):
-                        candidates['company'].append((text, score))
-                    else:
-                        self.logger.debug(f"GLiNER: Rejected location as company: {text}")
-
-            elif 'location' in label or 'city' in label or 'address' in label:
-                field = 'location'
-                if score < FIELD_THRESHOLDS[field]:
-                    self.logger.debug(f"GLiNER: Skipping low-confidence location ({score:.2f}): {text}")
+                if text.lower() in self.generic_company_terms:
+                    continue
+                # CRITICAL: Check if it's actually a location before adding as company
+                if self._is_location(text):
+                    logger.debug("GLiNER: Rejected location as company: %s", text)
                     continue
-                # Valid locations: no emails, no phone numbers
-                if '@' not in text and not any(char.isdigit() for c in text.split()[0:2] for char in c):
-                    candidates['location'].append((text, score))
 
-            elif 'job title' in label or 'position' in label or 'role' in label:
-                field = 'job_title'
-                if score < FIELD_THRESHOLDS[field]:
-                    self.logger.debug(f"GLiNER: Skipping low-confidence title ({score:.2f}): {text}")
+            elif field == 'location':
+                # Valid locations: no emails, no phone numbers
+                if '@' in text or _DIGIT_RE.search(' '.join(text.split()[:2])):
                     continue
-                candidates['job_title'].append((text, score))
-
-        # Select best candidate for each field (highest score)
-        for field, items in candidates.items():
-            if items:
-                # Sort by score descending
-                items.sort(key=lambda x: x[1], reverse=True)
-                entities[field] = items[0][0]  # Take highest scored
+
+            # Highest scored candidate so far
+            entities[field] = text
+            best_scores[field] = score
 
         return entities
@@ -1,5 +1,6 @@
 import spacy
-from typing import Optional, Dict, List, TypedDict
+from typing import Optional, Dict, List, Mapping, TypedDict
+from types import MappingProxyType
 import logging
 import re
 import tldextract
@@ -38,59 +39,233 @@ COMPANY_PENALTIES = {
 
 MIN_COMPANY_SCORE = 0.70  # Minimum score to accept candidate
 
+# Sign-off greetings shared by the signature patterns below
+_SIGN_OFFS = r'Warm regards|Kind regards|Sincerely|Regards|Thanks|Cheers|Best'
+
+# Signature name patterns, compiled once (see extract_name_from_signature)
+_SIGNATURE_NAME_PATTERNS = [
+    re.compile(pattern, re.MULTILINE) for pattern in (
+        # After greeting with newline
+        r'(?:' + _SIGN_OFFS + r'),?\s*[\r\n]+\s*([A-Z][a-z]+(?:[\s-][A-Z][a-z]+){1,2})\s*[\r\n]',
+        # Name followed by title/company
+        r'([A-Z][a-z]+(?:[\s-][A-Z][a-z]+){1,2})\s*[\r\n]+(?:Senior|Lead|Director|Manager|Recruiter|VP|President)',
+        # Name followed by phone or email on next line
+        r'([A-Z][a-z]+(?:[\s-][A-Z][a-z]+){1,2})\s*[\r\n]+(?:Phone|Mobile|Email|Tel):',
+        # Simple pattern
+        r'(?:Thanks|Regards|Best|Sincerely),?\s*[\r\n]+\s*([A-Z][a-z]+(?:[\s][A-Z][a-z]+){1,2})',
+    )
+]
+
+# A line that is only a sign-off greeting (see extract_signature_info)
+_SIGNATURE_GREETING_RE = re.compile(
+    r'^(?:' + _SIGN_OFFS + r'),?\s*$',
+    re.IGNORECASE
+)
+
+_DIGIT_RE = re.compile(r'\d')
+_ALPHA_RE = re.compile(r'[^\W\d_]')  # any letter
+
+# One match per line (including empty lines), without the newline
+_LINE_RE = re.compile(r'^.*$', re.MULTILINE)
+
+# Vendor "Name <sep> Company" patterns (see extract_vendor_from_span)
+# RELAXED PATTERNS: Allow special chars like _, (), ', - in company names and don't enforce leading Capital
+# Company runs are bounded (valid companies are < 100 chars) so failed matches can't backtrack far
+_COMPANY_CHARS = r"[a-zA-Z0-9\s&.,_()'\-]{1,100}?"
+_VENDOR_NAME = r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}'
+# One scan for every form; named groups tell which alternative matched and the
+# (?P=tag) backreference requires the closing tag to match the opening one
+_VENDOR_SPAN_RE = re.compile(
+    # HTML tags with Name - Company, Name | Company, Name, Company or Name (Company)
+    r'<(?P<tag>span|div|p|td|th|b|strong)\b[^>]*>\s*\b(?P<n1>' + _VENDOR_NAME + r')\b'
+    # (a closing paren is required after '(' and never consumed after a separator,
+    # so 'Acme Solutions (USA)' keeps its own parenthetical)
+    r'\s*(?:[-–—|,]\s*(?P<c1>' + _COMPANY_CHARS + r')|\(\s*(?P<c1b>' + _COMPANY_CHARS + r')\s*\))\s*</(?P=tag)>'
+    # Name at Company format
+    r'|<(?P<at_tag>span|div|p)\b[^>]*>\s*\b(?P<n2>' + _VENDOR_NAME + r')\b'
+    r'\s+at\s+(?P<c2>' + _COMPANY_CHARS + r')\s*</(?P=at_tag)>'
+    # Plain text with Name - Company or Name | Company (for text emails)
+    r'|(?:^|\n)\s*\b(?P<n3>' + _VENDOR_NAME + r')\b\s*[-–—|]\s*(?P<c3>' + _COMPANY_CHARS + r')\s*(?:$|\n)',
+    re.MULTILINE
+)
+# (name group, company group) per _VENDOR_SPAN_RE alternative; exactly one
+# company group takes part in any match
+_VENDOR_SPAN_GROUPS = (('n1', 'c1'), ('n1', 'c1b'), ('n2', 'c2'), ('n3', 'c3'))
+
+# Strips markup from span-extracted company names
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# spaCy entity label -> extract_entities field
+_ENTITY_FIELDS = {'PERSON': 'name', 'ORG': 'company', 'GPE': 'location', 'LOC': 'location'}
+
+# Simple From header: a quoted name, or single-spaced atoms (the only forms for
+# which the display name equals what parseaddr would return), then <addr>.
+# An address holding a comment, <a@b.com (work)>, is left to parseaddr, which
+# folds the comment into the display name
+_FROM_HEADER_RE = re.compile(
+    r'\s*(?:"([^"\\]*)"|([^\s"<>()\[\],;:@\\]+(?: [^\s"<>()\[\],;:@\\]+)*))\s*<[^<>"()]*>\s*$'
+)
+
+# Company candidate rejection checks (see _is_valid_company_candidate)
+_TIMESTAMP_RE = re.compile(
+    r'\d{1,2}:\d{2}\s*(AM|PM|am|pm)'  # 11:30 AM
+    r'|(AM|PM)\s+(PST|EST|CST|MST|PDT|EDT|CDT|MDT)'  # AM PST
+    r'|\d{1,2}\s*(AM|PM)'  # 11 AM
+)
+_WEEKDAY_RE = re.compile(r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b')
+_REQUISITION_ID_RE = re.compile(r'\b[A-Z]{1,4}-\d{3,}\)?$')
+_EMBEDDED_PHONE_RE = re.compile(r':\s*\d{3}|\d{3}[-.\s]\d{3}[-.\s]\d{4}')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# Introduction patterns, in priority order (see extract_company_from_body_intro)
+_BODY_INTRO_PATTERNS = tuple(
+    re.compile(pattern, re.MULTILINE | re.IGNORECASE) for pattern in (
+        # "I'm from/with/at Company"
+        r"(?:I'?m|I am)\s+(?:from|with|at)\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
+        # "I work for/at/with Company"
+        r"(?:I|We)\s+work\s+(?:for|at|with)\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
+        # "I represent Company"
+        r"(?:I|We)\s+represent\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
+        # "calling from Company"
+        r"calling\s+from\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
+        # "reaching out from Company"
+        r"reaching\s+out\s+from\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
+        # "Name - Title at Company"
+        r"(?:^|\n)\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}\s*[-–—]\s*[A-Za-z\s]+\s+at\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|\n|$)",
+        # "working with Company"
+        r"working\s+with\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
+        # "on behalf of Company"
+        r"on\s+behalf\s+of\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
+    )
+)
+
+# Explicit client mentions, in priority order (see extract_client_company_explicit)
+_CLIENT_EXPLICIT_PATTERNS = tuple(
+    re.compile(pattern, re.MULTILINE | re.IGNORECASE) for pattern in (
+        # "Client: Company" or "End Client: Company"
+        r"(?:end\s+)?client\s*:\s*([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
+        # "Client Name: Company"
+        r"client\s+name\s*:\s*([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
+        # "Our client, Company" or "our client Company"
+        r"our\s+client[,\s]+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
+        # "for our client Company"
+        r"for\s+our\s+client\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
+        # "Client Company Name: XYZ"
+        r"client\s+company\s+name\s*:\s*([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
+        # "working with client Company"
+        r"working\s+with\s+(?:our\s+)?client\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
+        # "Position with [Company]" or "Position at [Company]" (in brackets/parentheses)
+        r"position\s+(?:with|at)\s+\[([A-Z][a-zA-Z0-9\s&.,'-]+?)\]",
+        r"position\s+(?:with|at)\s+\(([A-Z][a-zA-Z0-9\s&.,'-]+?)\)",
+    )
+)
+
+# Position context patterns, in priority order (see extract_company_from_position_context)
+_POSITION_CONTEXT_PATTERNS = tuple(
+    re.compile(pattern, re.MULTILINE | re.IGNORECASE) for pattern in (
+        # "Position/Role/Job at Company"
+        r"(?:position|role|job|opportunity)\s+(?:at|with)\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+in\s|\s+for\s|\s+located\s|\n|$)",
+        # "Job Title at Company" (e.g., "Java Developer at ABC Corp")
+        r"(?:developer|engineer|analyst|manager|architect|consultant|specialist|lead|senior|junior)\s+at\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+in\s|\s+for\s|\s+located\s|\n|$)",
+        # "Job Title with Company"
+        r"(?:developer|engineer|analyst|manager|architect|consultant|specialist|lead|senior|junior)\s+with\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+in\s|\s+for\s|\s+located\s|\n|$)",
+        # "opening at Company"
+        r"opening\s+at\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+in\s|\s+for\s|\s+located\s|\n|$)",
+        # "vacancy at Company"
+        r"vacancy\s+at\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+in\s|\s+for\s|\s+located\s|\n|$)",
+    )
+)
+
 class SpacyNERExtractor:
     """Extract entities using Spacy NER"""
     
     def __init__(self, model: str = 'en_core_web_sm'):
         self.logger = logging.getLogger(__name__)
         try:
-            self.nlp = spacy.load(model)
+            # Lemmas are never read; the parser stays for PositionExtractor's noun_chunks
+            self.nlp = spacy.load(model, exclude=['lemmatizer'])
             self.logger.info(f"Loaded Spacy model: {model}")
         except OSError:
             self.logger.error(f"Spacy model '{model}' not found. Run: python -m spacy download {model}")
             raise
         
         
+        # Entity extraction only reads doc.ents - skip tagger/parser for those calls
+        self.ner_disabled_pipes = self._ner_disabled_pipes()
+        
+        # Last (text, entities) pair - name, company and location fallbacks all
+        # ask for NER on the same body, so only the first request runs the model
+        self._last_entities = None
+        
+        # full domain -> formatted company name (see extract_company_from_domain)
+        self._domain_company_cache = {}
+        
         # Load filter repository
         self.filter_repo = get_filter_repository()
         
-        # Load filter lists from CSV for company extraction
-        self.job_title_keywords = self._load_job_title_keywords()
-        self.company_suffixes = self._load_company_suffixes()
-        self.ats_domains = self._load_ats_domains()
-        self.client_keywords = self._load_client_keywords()
-        self.generic_terms = self._load_generic_terms()
-        self.vendor_indicators = self._load_vendor_indicators()
+        # Load filter lists from CSV for company extraction. The keyword lists are
+        # built once and shared by every loader (each build re-splits every rule)
+        try:
+            keyword_lists = self.filter_repo.get_keyword_lists()
+        except Exception as e:
+            self.logger.error(f"Failed to load keyword lists from CSV: {str(e)} - using empty lists")
+            keyword_lists = {}
+        
+        self.job_title_keywords = self._load_job_title_keywords(keyword_lists)
+        self._job_title_re = self._compile_keyword_matcher(self.job_title_keywords)
+        self.company_suffixes = self._load_company_suffixes(keyword_lists)
+        # Suffix lengths, longest first: a lookup probes one dict slice per length
+        self._company_suffix_lengths = sorted({len(old) for old in self.company_suffixes if old}, reverse=True)
+        self.ats_domains = self._load_ats_domains(keyword_lists)
+        self.client_keywords = self._load_client_keywords(keyword_lists)
+        self.generic_terms = self._load_generic_terms(keyword_lists)
+        self.vendor_indicators = self._load_vendor_indicators(keyword_lists)
         
         # NEW: Location indicators and city lists
-        self.location_indicators = self._load_list_filter('ner_location_indicators')
-        self.common_cities = self._load_list_filter('ner_common_cities')
-        self.ner_company_suffixes = self._load_list_filter('ner_company_suffixes')
+        self.location_indicators = self._load_list_filter(keyword_lists, 'ner_location_indicators')
+        self.common_cities = self._load_list_filter(keyword_lists, 'ner_common_cities')
+        self.ner_company_suffixes = self._load_list_filter(keyword_lists, 'ner_company_suffixes')
+    
+    def _ner_disabled_pipes(self) -> List[str]:
+        """Pipes NER does not depend on - ner plus any shared tok2vec/transformer it listens to stay on"""
+        # The trained pipelines give ner its own embedding layer, in which case
+        # the shared tok2vec only feeds tagger/parser and can be skipped as well
+        needed = {'ner'}
+        for name, pipe in self.nlp.pipeline:
+            if 'ner' in getattr(pipe, 'listening_components', ()):
+                needed.add(name)
+        return [name for name in self.nlp.pipe_names if name not in needed]
+    
+    @staticmethod
+    def _compile_keyword_matcher(keywords) -> Optional[re.Pattern]:
+        """Compile keywords into one regex equivalent to any(kw in text)"""
+        if not keywords:
+            return None
+        # Longest first so overlapping keywords don't shadow each other
+        ordered = sorted(set(keywords), key=len, reverse=True)
+        return re.compile('|'.join(map(re.escape, ordered)))
     
-    def _load_job_title_keywords(self) -> set:
+    def _load_job_title_keywords(self, keyword_lists: dict) -> frozenset:
         """Load job title keywords from filter repository (CSV only - no fallback)"""
         try:
-            keyword_lists = self.filter_repo.get_keyword_lists()
-            
             if 'job_title_keywords' in keyword_lists:
                 keywords = keyword_lists['job_title_keywords']
-                # Convert to set and lowercase
-                job_titles = {kw.lower().strip() for kw in keywords}
+                # Convert to frozenset and lowercase (read-only after load)
+                job_titles = frozenset(kw.lower().strip() for kw in keywords)
                 self.logger.info(f"✓ Loaded {len(job_titles)} job title keywords from CSV")
                 return job_titles
             else:
                 self.logger.error("⚠ job_title_keywords not found in CSV - using empty set")
-                return set()
+                return frozenset()
                 
         except Exception as e:
             self.logger.error(f"Failed to load job title keywords from CSV: {str(e)} - using empty set")
-            return set()  # No hardcoded fallback - return empty set
+            return frozenset()  # No hardcoded fallback - return empty set
     
-    def _load_company_suffixes(self) -> dict:
+    def _load_company_suffixes(self, keyword_lists: dict) -> Mapping[str, str]:
         """Load company suffix mappings from filter repository (CSV only - no fallback)"""
         try:
-            keyword_lists = self.filter_repo.get_keyword_lists()
-            
             if 'company_suffix_mapping' in keyword_lists:
                 # Parse suffix mappings from CSV (format: "old|new, old2|new2")
                 mappings_str = keyword_lists['company_suffix_mapping']
@@ -103,22 +278,21 @@ class SpacyNERExtractor:
                 
                 if suffixes:
                     self.logger.info(f"✓ Loaded {len(suffixes)} company suffix mappings from CSV")
-                    return suffixes
+                    return MappingProxyType(suffixes)
                 else:
                     self.logger.error("⚠ No valid suffix mappings found in CSV - using empty dict")
-                    return {}
+                    return MappingProxyType({})
             else:
                 self.logger.error("⚠ company_suffix_mapping not found in CSV - using empty dict")
-                return {}
+                return MappingProxyType({})
                 
         except Exception as e:
             self.logger.error(f"Failed to load company suffixes from CSV: {str(e)} - using empty dict")
-            return {}  # No hardcoded fallback - return empty dict
+            return MappingProxyType({})  # No hardcoded fallback - return empty dict
     
-    def _load_ats_domains(self) -> list:
+    def _load_ats_domains(self, keyword_lists: dict) -> list:
         """Load ATS platform domains from CSV (CSV only - no fallback)"""
         try:
-            keyword_lists = self.filter_repo.get_keyword_lists()
             # Check both old and new category names
             for category in ['blocked_ats_domain', 'ats_domains']:
                 if category in keyword_lists:
@@ -132,10 +306,9 @@ class SpacyNERExtractor:
             self.logger.error(f"Failed to load ATS domains from CSV: {str(e)} - using empty list")
             return []
     
-    def _load_client_keywords(self) -> list:
+    def _load_client_keywords(self, keyword_lists: dict) -> list:
         """Load client language keywords from CSV (CSV only - no fallback)"""
         try:
-            keyword_lists = self.filter_repo.get_keyword_lists()
             if 'client_language_keywords' in keyword_lists:
                 keywords = keyword_lists['client_language_keywords']
                 self.logger.info(f"✓ Loaded {len(keywords)} client language keywords from CSV")
@@ -147,10 +320,9 @@ class SpacyNERExtractor:
             self.logger.error(f"Failed to load client keywords from CSV: {str(e)} - using empty list")
             return []
     
-    def _load_generic_terms(self) -> list:
+    def _load_generic_terms(self, keyword_lists: dict) -> list:
         """Load generic company terms from CSV (CSV only - no fallback)"""
         try:
-            keyword_lists = self.filter_repo.get_keyword_lists()
             if 'generic_company_terms' in keyword_lists:
                 terms = keyword_lists['generic_company_terms']
                 self.logger.info(f"✓ Loaded {len(terms)} generic company terms from CSV")
@@ -162,57 +334,28 @@ class SpacyNERExtractor:
             self.logger.error(f"Failed to load generic terms from CSV: {str(e)} - using empty list")
             return []
     
-    def _load_vendor_indicators(self) -> set:
+    def _load_vendor_indicators(self, keyword_lists: dict) -> frozenset:
         """Load vendor indicators from filter repository (CSV)"""
         try:
-            keyword_lists = self.filter_repo.get_keyword_lists()
             if 'vendor_indicators' in keyword_lists:
-                return {kw.lower().strip() for kw in keyword_lists['vendor_indicators']}
-            return set()
+                return frozenset(kw.lower().strip() for kw in keyword_lists['vendor_indicators'])
+            return frozenset()
         except Exception as e:
             self.logger.error(f"Error loading vendor indicators: {str(e)}")
-            return set()
+            return frozenset()
 
-    def _load_list_filter(self, category: str) -> set:
+    def _load_list_filter(self, keyword_lists: dict, category: str) -> frozenset:
         """Generic method to load keyword list from filter repository"""
         try:
-            keyword_lists = self.filter_repo.get_keyword_lists()
             if category in keyword_lists:
                 self.logger.info(f"✓ Loaded {len(keyword_lists[category])} {category} from CSV")
-                return {kw.lower().strip() for kw in keyword_lists[category]}
+                return frozenset(kw.lower().strip() for kw in keyword_lists[category])
             self.logger.warning(f"⚠ {category} not found in CSV")
-            return set()
+            return frozenset()
         except Exception as e:
             self.logger.error(f"Error loading {category}: {str(e)}")
-            return set()
+            return frozenset()
     
-    def extract_vendor_from_span(self, html_content: str) -> Dict[str, Optional[str]]:
-        """Extract vendor name and company from HTML span tags (e.g. <span>Name - Company</span>) with relaxed matching"""
-        try:
-            if not html_content:
-                return {'name': None, 'company': None}
-            
-            # Simple regex on HTML to find span content
-            # Pattern: <span ...>Name - Company</span>
-            # Relaxed: Allow _ in company parts (e.g. "_Acme Corp_")
-            span_pattern = r'<span[^>]*>\s*([A-Za-z0-9\s\.]+)\s*[:\-]+\s*([A-Za-z0-9_\-&. ]+)\s*</span>'
-            
-            match = re.search(span_pattern, html_content, re.IGNORECASE)
-            if match:
-                name = match.group(1).strip()
-                company = match.group(2).strip(' _')  # Strip spaces and underscores
-                
-                # Basic validation
-                if len(company) > 1 and len(company) < 100:
-                    self.logger.debug(f"✓ Extracted vendor info from span: {name} - {company}")
-                    return {'name': name, 'company': company}
-            
-            return {'name': None, 'company': None}
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting vendor from span: {str(e)}")
-            return {'name': None, 'company': None}
-
     def extract_entities(self, text: str) -> Dict[str, str]:
         """
         Extract named entities from text
@@ -221,66 +364,69 @@ class SpacyNERExtractor:
             Dictionary with keys: name, company, location
         """
         try:
-            doc = self.nlp(text)
+            # One read: another worker thread may replace the pair meanwhile
+            last_entities = self._last_entities
+            if last_entities and last_entities[0] == text:
+                return dict(last_entities[1])
             
-            entities = {
-                'name': None,
-                'company': None,
-                'location': None
-            }
-            
-            for ent in doc.ents:
-                if ent.label_ == 'PERSON' and not entities['name']:
-                    # Filter out single-word names (likely false positives)
-                    if len(ent.text.split()) >= 2 and len(ent.text.split()) <= 3:
-                        entities['name'] = ent.text.strip()
-                
-                elif ent.label_ == 'ORG' and not entities['company']:
-                    # Filter out job titles and locations
-                    company_candidate = ent.text.strip()
-                    if not self._is_job_title(company_candidate) and not self._is_location(company_candidate):
-                        entities['company'] = company_candidate
-                    elif self._is_location(company_candidate):
-                        self.logger.debug(f"Spacy NER: Rejected location classified as ORG: {company_candidate}")
-                
-                elif ent.label_ in ['GPE', 'LOC'] and not entities['location']:
-                    entities['location'] = ent.text.strip()
-            
-            return entities
+            doc = self.nlp(text, disable=self.ner_disabled_pipes)
+            entities = self._entities_from_doc(doc)
+            self._last_entities = (text, entities)
+            return dict(entities)
             
         except Exception as e:
             self.logger.error(f"Error in Spacy NER extraction: {str(e)}")
             return {'name': None, 'company': None, 'location': None}
     
-    def extract_name_from_signature(self, text: str) -> Optional[str]:
-        """Extract name from email signature patterns with better patterns"""
-        try:
-            # Enhanced signature patterns
-            patterns = [
-                # After greeting with newline
-                r'(?:Thanks|Regards|Best|Sincerely|Warm regards|Kind regards|Cheers),?\s*[\r\n]+\s*([A-Z][a-z]+(?:[\s-][A-Z][a-z]+){1,2})\s*[\r\n]',
-                # Name followed by title/company
-                r'([A-Z][a-z]+(?:[\s-][A-Z][a-z]+){1,2})\s*[\r\n]+(?:Senior|Lead|Director|Manager|Recruiter|VP|President)',
-                # Name followed by phone or email on next line
-                r'([A-Z][a-z]+(?:[\s-][A-Z][a-z]+){1,2})\s*[\r\n]+(?:Phone|Mobile|Email|Tel):',
-                # Simple pattern
-                r'(?:Thanks|Regards|Best|Sincerely),?\s*[\r\n]+\s*([A-Z][a-z]+(?:[\s][A-Z][a-z]+){1,2})',
-            ]
+    def _entities_from_doc(self, doc) -> Dict[str, str]:
+        """Pick the first valid name, company and location from a parsed doc"""
+        entities = {
+            'name': None,
+            'company': None,
+            'location': None
+        }
+        
+        for ent in doc.ents:
+            field = _ENTITY_FIELDS.get(ent.label_)
+            if field is None or entities[field]:
+                continue
             
-            for pattern in patterns:
-                match = re.search(pattern, text, re.MULTILINE)
-                if match:
-                    name = match.group(1).strip()
-                    # Validate
-                    words = name.split()
-                    if 2 <= len(words) <= 3 and not any(c.isdigit() for c in name):
-                        return name
+            text = ent.text.strip()
+            if field == 'name':
+                # Filter out single-word names (likely false positives)
+                if not 2 <= len(text.split()) <= 3:
+                    continue
+            elif field == 'company':
+                # Filter out job titles and locations
+                if self._is_job_title(text):
+                    continue
+                if self._is_location(text):
+                    self.logger.debug("Spacy NER: Rejected location classified as ORG: %s", text)
+                    continue
             
+            entities[field] = text
             
+            # All three fields found - the remaining entities can't change the result
+            if entities['name'] and entities['company'] and entities['location']:
+                break
+        
+        return entities
+    
+    def extract_name_from_signature(self, text: str) -> Optional[str]:
+        """Extract name from email signature patterns with better patterns"""
+        if not text:
             return None
-        except Exception as e:
-            self.logger.error(f"Error extracting name from signature: {str(e)}")
-            return None
+        
+        # Pure regex over a str - nothing here can raise, so no try/except wrapper
+        for pattern in _SIGNATURE_NAME_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                name = match.group(1).strip()
+                # Validate (the patterns only capture letters, spaces and hyphens)
+                if 2 <= len(name.split()) <= 3:
+                    return name
+        
+        return None
 
     def extract_signature_info(self, text: str) -> Dict[str, Optional[str]]:
         """
@@ -306,23 +452,20 @@ class SpacyNERExtractor:
             # Find name line (usually starts with Thanks/Regards or is just a name)
             name_idx = -1
             
-            # Greeting patterns
-            greeting_pattern = r'^(?:Thanks|Regards|Best|Sincerely|Warm regards|Kind regards|Cheers),?\s*$'
-            
             for i, line in enumerate(sig_lines):
                 line = line.strip()
                 if not line:
                     continue
                     
                 # Check if this line is a greeting
-                if re.match(greeting_pattern, line, re.IGNORECASE):
+                if _SIGNATURE_GREETING_RE.match(line):
                     # Next non-empty line is likely the name
                     for j in range(i + 1, len(sig_lines)):
                         potential_name = sig_lines[j].strip()
                         if potential_name:
                             # Validate name
                             words = potential_name.split()
-                            if 2 <= len(words) <= 4 and not any(c.isdigit() for c in potential_name):
+                            if 2 <= len(words) <= 4 and not _DIGIT_RE.search(potential_name):
                                 result['name'] = potential_name
                                 name_idx = j
                                 break
@@ -335,7 +478,7 @@ class SpacyNERExtractor:
                 potential_title = sig_lines[name_idx + 1].strip()
                 if potential_title and len(potential_title.split()) <= 6:
                      # Basic validation: Shouldn't be a phone number or email
-                    if not re.search(r'\d', potential_title) and '@' not in potential_title:
+                    if not _DIGIT_RE.search(potential_title) and '@' not in potential_title:
                         result['title'] = potential_title
                 
                 # Line after title is often Company
@@ -364,46 +507,33 @@ class SpacyNERExtractor:
             Dictionary with keys: name, company
         """
         try:
-            # Multiple patterns to try (ordered by reliability)
-            # RELAXED PATTERNS: Allow special chars like _, (), ', - in company names and don't enforce leading Capital
-            company_chars = r"[a-zA-Z0-9\s&.,_()'\-]"
-            
-            patterns = [
-                # Pattern 1: HTML tags with Name - Company (hyphen separator)
-                r'<(?:span|div|p|td|th|b|strong)[^>]*>\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*[-–—]\s*(' + company_chars + r'+?)\s*</(?:span|div|p|td|th|b|strong)>',
-                # Pattern 2: HTML tags with Name | Company (pipe separator)
-                r'<(?:span|div|p|td|th|b|strong)[^>]*>\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*\|\s*(' + company_chars + r'+?)\s*</(?:span|div|p|td|th|b|strong)>',
-                # Pattern 3: HTML tags with Name, Company (comma separator)
-                r'<(?:span|div|p|td|th|b|strong)[^>]*>\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*,\s*(' + company_chars + r'+?)\s*</(?:span|div|p|td|th|b|strong)>',
-                # Pattern 4: HTML tags with Name (Company) (parentheses)
-                r'<(?:span|div|p|td|th|b|strong)[^>]*>\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*\(\s*(' + company_chars + r'+?)\s*\)\s*</(?:span|div|p|td|th|b|strong)>',
-                # Pattern 5: Plain text with Name - Company (for text emails)
-                r'(?:^|\n)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*[-–—]\s*(' + company_chars + r'+?)\s*(?:$|\n)',
-                # Pattern 6: Plain text with Name | Company
-                r'(?:^|\n)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*\|\s*(' + company_chars + r'+?)\s*(?:$|\n)',
-                # Pattern 7: Name at Company format
-                r'<(?:span|div|p)[^>]*>\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s+at\s+(' + company_chars + r'+?)\s*</(?:span|div|p)>',
-            ]
+            if not text:
+                return {'name': None, 'company': None}
             
-            for pattern in patterns:
-                match = re.search(pattern, text, re.MULTILINE)
-                if match:
-                    name = match.group(1).strip()
-                    company = match.group(2).strip()
-                    
-                    # Validate name (2-4 words, no digits, no special chars except space and hyphen)
-                    name_words = name.split()
-                    if 2 <= len(name_words) <= 4 and not any(c.isdigit() for c in name):
-                        # Clean company name
-                        # Remove HTML tags, extra whitespace, trailing punctuation AND underscores
-                        company = re.sub(r'<[^>]+>', '', company)  # Remove any HTML tags
-                        company = re.sub(r'\s+', ' ', company)      # Normalize whitespace
-                        company = company.strip('.,;: _-')          # Strip delimiters including _
-                        
-                        # Validate company (not empty, not too long, has letters)
-                        if company and 1 < len(company) < 100 and any(c.isalpha() for c in company):
-                            self.logger.info(f"✓ Extracted vendor from pattern: {name} - {company}")
-                            return {'name': name, 'company': company}
+            for match in _VENDOR_SPAN_RE.finditer(text):
+                name, company = next(
+                    match.group(name_group, company_group)
+                    for name_group, company_group in _VENDOR_SPAN_GROUPS
+                    if match.group(company_group) is not None
+                )
+                name = name.strip()
+                company = company.strip()
+                
+                # Validate name (2-4 words, no digits, no special chars except space and hyphen)
+                name_words = name.split()
+                if not (2 <= len(name_words) <= 4) or _DIGIT_RE.search(name):
+                    continue
+                
+                # Clean company name
+                # Remove HTML tags, extra whitespace, trailing punctuation AND underscores
+                company = _HTML_TAG_RE.sub('', company)     # Remove any HTML tags
+                company = _WHITESPACE_RE.sub(' ', company)  # Normalize whitespace
+                company = company.strip('.,;: _-')          # Strip delimiters including _
+                
+                # Validate company (not empty, not too long, has letters)
+                if company and 1 < len(company) < 100 and _ALPHA_RE.search(company):
+                    self.logger.info(f"✓ Extracted vendor from pattern: {name} - {company}")
+                    return {'name': name, 'company': company}
             
             return {'name': None, 'company': None}
         except Exception as e:
@@ -456,12 +586,7 @@ class SpacyNERExtractor:
             return False
         
         # 2. REJECT: Timestamp patterns (AM PST, PM EST, 11:30 AM, etc.)
-        timestamp_patterns = [
-            r'^\d{1,2}:\d{2}\s*(AM|PM|am|pm)',  # 11:30 AM
-            r'^(AM|PM)\s+(PST|EST|CST|MST|PDT|EDT|CDT|MDT)',  # AM PST
-            r'^\d{1,2}\s*(AM|PM)',  # 11 AM
-        ]
-        if any(re.match(pattern, company) for pattern in timestamp_patterns):
+        if _TIMESTAMP_RE.match(company):
             self.logger.debug(f"❌ Company is timestamp: {company}")
             return False
         
@@ -529,17 +654,17 @@ class SpacyNERExtractor:
 
         # 9b. REJECT: Day-of-week substrings (Google Calendar invite fragments like
         #     "Thursday Feb 26, 2026 ⋅ 3pm – 3:45pm")
-        if re.search(r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b', company_lower):
+        if _WEEKDAY_RE.search(company_lower):
             self.logger.debug(f"❌ Company contains day-of-week (calendar fragment): {company}")
             return False
 
         # 9c. REJECT: Requisition / job-ID patterns (e.g. "AI-25237)", "REQ-1234")
-        if re.search(r'\b[A-Z]{1,4}-\d{3,}\)?$', company):
+        if _REQUISITION_ID_RE.search(company):
             self.logger.debug(f"❌ Company looks like a requisition ID: {company}")
             return False
 
         # 9d. REJECT: Phone numbers embedded in string (e.g. "Desk : 609-998-5909")
-        if re.search(r':\s*\d{3}', company) or re.search(r'\d{3}[-.\s]\d{3}[-.\s]\d{4}', company):
+        if _EMBEDDED_PHONE_RE.search(company):
             self.logger.debug(f"❌ Company contains embedded phone number: {company}")
             return False
 
@@ -638,8 +763,13 @@ class SpacyNERExtractor:
             if not from_header:
                 return None
             
-            # Parse email header
-            name, email_addr = parseaddr(from_header)
+            # Parse email header: the common '"Name" <addr>' / 'Name <addr>' forms
+            # via one regex, anything else (comments, escapes, groups) via parseaddr
+            match = _FROM_HEADER_RE.match(from_header)
+            if match:
+                name = match.group(1) if match.group(1) is not None else match.group(2)
+            else:
+                name = parseaddr(from_header)[0]
             
             # Clean up the name
             if name:
@@ -656,7 +786,7 @@ class SpacyNERExtractor:
                     return None
                 
                 # Skip if has numbers (likely username)
-                if any(char.isdigit() for char in name):
+                if _DIGIT_RE.search(name):
                     return None
                 
                 return name.strip()
@@ -686,48 +816,63 @@ class SpacyNERExtractor:
                 self.logger.debug(f"Blocked personal/generic domain: {full_domain}")
                 return None
             
-            # Use tldextract to get root domain (handles subdomains properly)
-            ext = tldextract.extract(full_domain)
-            company_name = ext.domain  # This is the root domain (e.g., 'accenture' from 'jobs.accenture.com')
-            
-            if not company_name:
-                return None
-            
-            # Check if it's an ATS platform domain (CSV-driven)
-            if self._is_ats_domain(full_domain):
-                self.logger.debug(f"✗ Rejected ATS domain: {full_domain}")
-                return None
-            
-            # Replace hyphens and underscores with spaces
-            company_name = company_name.replace('-', ' ').replace('_', ' ')
-            
-            # Title case each word
-            company_name = ' '.join(word.capitalize() for word in company_name.split())
-            
-            # Clean up with standard cleaning
-            company_name = self._clean_company_name(company_name)
-            
-            if company_name:
-                self.logger.debug(f"✓ Extracted company from domain: {company_name} (from {full_domain})")
+            # Domain -> company formatting depends only on the domain; many emails
+            # share a sender domain, so reuse the tldextract/cleanup result. One
+            # lookup, not 'in' then []: worker threads share this memo and a
+            # concurrent clear() could land in between
+            try:
+                return self._domain_company_cache[full_domain]
+            except KeyError:
+                pass
             
+            company_name = self._company_from_domain(full_domain)
+            if len(self._domain_company_cache) >= 4096:
+                self._domain_company_cache.clear()
+            self._domain_company_cache[full_domain] = company_name
             return company_name
             
         except Exception as e:
             self.logger.error(f"Error extracting company from domain: {str(e)}")
             return None
     
+    def _company_from_domain(self, full_domain: str) -> Optional[str]:
+        """Format a company name from a (non-blocked) domain - cached by extract_company_from_domain"""
+        # Check if it's an ATS platform domain (CSV-driven) - a plain substring
+        # check, so reject before paying for the tldextract lookup
+        if self._is_ats_domain(full_domain):
+            self.logger.debug(f"✗ Rejected ATS domain: {full_domain}")
+            return None
+        
+        # Use tldextract to get root domain (handles subdomains properly)
+        ext = tldextract.extract(full_domain)
+        company_name = ext.domain  # This is the root domain (e.g., 'accenture' from 'jobs.accenture.com')
+        
+        if not company_name:
+            return None
+        
+        # Replace hyphens and underscores with spaces
+        company_name = company_name.replace('-', ' ').replace('_', ' ')
+        
+        # Title case each word
+        company_name = ' '.join(word.capitalize() for word in company_name.split())
+        
+        # Clean up with standard cleaning
+        company_name = self._clean_company_name(company_name)
+        
+        if company_name:
+            self.logger.debug(f"✓ Extracted company from domain: {company_name} (from {full_domain})")
+        
+        return company_name
+    
     def _is_job_title(self, text: str) -> bool:
         """Check if text is likely a job title rather than a company name"""
         if not text:
             return False
         
-        text_lower = text.lower()
-        
-        # Check if any job title keyword appears in the text
-        for keyword in self.job_title_keywords:
-            if keyword in text_lower:
-                self.logger.debug(f"Rejected job title as company: {text}")
-                return True
+        # Check if any job title keyword appears in the text (one scan for all keywords)
+        if self._job_title_re and self._job_title_re.search(text.lower()):
+            self.logger.debug("Rejected job title as company: %s", text)
+            return True
         
         return False
     
@@ -737,7 +882,7 @@ class SpacyNERExtractor:
             return False
         
         text_lower = text.lower().strip()
-        text_clean = re.sub(r'[^\w\s]', '', text_lower)  # Remove punctuation
+        text_clean = _PUNCT_RE.sub('', text_lower)  # Remove punctuation
         
         # Check if text contains location indicators (WITH WORD BOUNDARIES)
         text_words = set(text_clean.split())
@@ -771,19 +916,18 @@ class SpacyNERExtractor:
         TechCorp Inc.
         """
         try:
-            # Look for company-like text after job title in signature
-            lines = text.split('\n')
-            
-            for i, line in enumerate(lines):
-                line_clean = line.strip()
+            # Look for company-like text after job title in signature.
+            # Lines are streamed so the scan stops at the first hit without
+            # splitting the whole text up front
+            prev_is_title = False
+            for line_match in _LINE_RE.finditer(text):
+                line_clean = line_match.group().strip()
                 
-                # If this line looks like a job title, next line might be company
-                if self._is_job_title(line_clean) and i + 1 < len(lines):
-                    potential_company = lines[i + 1].strip()
-                    
-                    # Validate it looks like a company
-                    if self._is_valid_company_name(potential_company):
-                        return self._clean_company_name(potential_company)
+                # Previous line looked like a job title - this line might be company
+                if prev_is_title and self._is_valid_company_name(line_clean):
+                    return self._clean_company_name(line_clean)
+                
+                prev_is_title = self._is_job_title(line_clean)
             
             return None
         except Exception as e:
@@ -800,33 +944,13 @@ class SpacyNERExtractor:
         - "calling from XYZ Solutions"
         """
         try:
-            # Common introduction patterns
-            patterns = [
-                # "I'm from/with/at Company"
-                r"(?:I'?m|I am)\s+(?:from|with|at)\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
-                # "I work for/at/with Company"
-                r"(?:I|We)\s+work\s+(?:for|at|with)\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
-                # "I represent Company"
-                r"(?:I|We)\s+represent\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
-                # "calling from Company"
-                r"calling\s+from\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
-                # "reaching out from Company"
-                r"reaching\s+out\s+from\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
-                # "Name - Title at Company"
-                r"(?:^|\n)\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}\s*[-–—]\s*[A-Za-z\s]+\s+at\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|\n|$)",
-                # "working with Company"
-                r"working\s+with\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
-                # "on behalf of Company"
-                r"on\s+behalf\s+of\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+and\s|\s+in\s|\s+for\s|\s+to\s|$)",
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text, re.MULTILINE | re.IGNORECASE)
+            for pattern in _BODY_INTRO_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     potential_company = match.group(1).strip()
                     
                     # Clean up the match
-                    potential_company = re.sub(r'\s+', ' ', potential_company)  # Normalize whitespace
+                    potential_company = _WHITESPACE_RE.sub(' ', potential_company)  # Normalize whitespace
                     potential_company = potential_company.strip('.,;: ')
                     
                     # Validate it looks like a company
@@ -851,32 +975,13 @@ class SpacyNERExtractor:
         - "for our client ABC Corp"
         """
         try:
-            # Explicit client patterns (case-insensitive)
-            patterns = [
-                # "Client: Company" or "End Client: Company"
-                r"(?:end\s+)?client\s*:\s*([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
-                # "Client Name: Company"
-                r"client\s+name\s*:\s*([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
-                # "Our client, Company" or "our client Company"
-                r"our\s+client[,\s]+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
-                # "for our client Company"
-                r"for\s+our\s+client\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
-                # "Client Company Name: XYZ"
-                r"client\s+company\s+name\s*:\s*([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
-                # "working with client Company"
-                r"working\s+with\s+(?:our\s+)?client\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+is\s|\s+has\s|\s+in\s|\n|$)",
-                # "Position with [Company]" or "Position at [Company]" (in brackets/parentheses)
-                r"position\s+(?:with|at)\s+\[([A-Z][a-zA-Z0-9\s&.,'-]+?)\]",
-                r"position\s+(?:with|at)\s+\(([A-Z][a-zA-Z0-9\s&.,'-]+?)\)",
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text, re.MULTILINE | re.IGNORECASE)
+            for pattern in _CLIENT_EXPLICIT_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     potential_company = match.group(1).strip()
                     
                     # Clean up the match
-                    potential_company = re.sub(r'\s+', ' ', potential_company)
+                    potential_company = _WHITESPACE_RE.sub(' ', potential_company)
                     potential_company = potential_company.strip('.,;: ')
                     
                     # Validate it looks like a company
@@ -900,27 +1005,13 @@ class SpacyNERExtractor:
         - "position with ABC Company"
         """
         try:
-            # Position context patterns
-            patterns = [
-                # "Position/Role/Job at Company"
-                r"(?:position|role|job|opportunity)\s+(?:at|with)\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+in\s|\s+for\s|\s+located\s|\n|$)",
-                # "Job Title at Company" (e.g., "Java Developer at ABC Corp")
-                r"(?:developer|engineer|analyst|manager|architect|consultant|specialist|lead|senior|junior)\s+at\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+in\s|\s+for\s|\s+located\s|\n|$)",
-                # "Job Title with Company"
-                r"(?:developer|engineer|analyst|manager|architect|consultant|specialist|lead|senior|junior)\s+with\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+in\s|\s+for\s|\s+located\s|\n|$)",
-                # "opening at Company"
-                r"opening\s+at\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+in\s|\s+for\s|\s+located\s|\n|$)",
-                # "vacancy at Company"
-                r"vacancy\s+at\s+([A-Z][a-zA-Z0-9\s&.,'-]+?)(?:\.|,|;|\s+in\s|\s+for\s|\s+located\s|\n|$)",
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text, re.MULTILINE | re.IGNORECASE)
+            for pattern in _POSITION_CONTEXT_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     potential_company = match.group(1).strip()
                     
                     # Clean up the match
-                    potential_company = re.sub(r'\s+', ' ', potential_company)
+                    potential_company = _WHITESPACE_RE.sub(' ', potential_company)
                     potential_company = potential_company.strip('.,;: ')
                     
                     # Validate it looks like a company
@@ -952,7 +1043,7 @@ class SpacyNERExtractor:
             return False
         
         # Must have at least some letters
-        if not any(c.isalpha() for c in text):
+        if not _ALPHA_RE.search(text):
             return False
         
         # Not too long (no company name should be > 100 chars)
@@ -1122,9 +1213,10 @@ class SpacyNERExtractor:
         
         # Standardize common suffixes (loaded from CSV)
         company_lower = company.lower()
-        for old, new in self.company_suffixes.items():
-            if company_lower.endswith(old):
-                company = company[:-len(old)] + new
+        for length in self._company_suffix_lengths:
+            new = self.company_suffixes.get(company_lower[-length:])
+            if new is not None:
+                company = company[:-length] + new
                 break
         
         return company
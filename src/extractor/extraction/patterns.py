@@ -1,6 +1,6 @@
 import re
 import phonenumbers
-from typing import Optional
+from typing import Iterator, Optional
 import logging
 from ..filtering.repository import get_filter_repository
 
@@ -10,7 +10,17 @@ class RegexExtractor:
     """Extract contact information using regex patterns"""
     
     def __init__(self):
+        # The lookbehind only lets a match start at the beginning of a local-part
+        # run: a long run with no '@' (base64, URLs) is scanned once instead of
+        # once per start position, which made findall quadratic in its length
         self.email_pattern = re.compile(
+            r'(?<![a-zA-Z0-9_.+-])[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+',
+            re.IGNORECASE
+        )
+        # The same address without the lookbehind, tried only where the previous
+        # match ended: finditer on the plain pattern resumed there, so in
+        # 'jane@acme.com_bob@corp.com' the second address still starts at '_'
+        self._email_resume_pattern = re.compile(
             r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+',
             re.IGNORECASE
         )
@@ -20,14 +30,30 @@ class RegexExtractor:
             re.IGNORECASE
         )
         
+        # CID-style domains made only of hex digits and dots (e.g. 01dc6e1f.089ef930)
+        self.hex_domain_pattern = re.compile(r'[0-9a-fA-F.]*')
+        
+        # Any letter (Unicode-aware, like str.isalpha)
+        self.alpha_pattern = re.compile(r'[^\W\d_]')
+        
+        # Any digit (Unicode-aware, so full-width digits still reach phonenumbers)
+        self.digit_pattern = re.compile(r'\d')
+        
         self.logger = logging.getLogger(__name__)
         self.filter_repo = get_filter_repository()
         
         # Load email blacklist prefixes from CSV (fallback to hardcoded)
         self.blacklist_prefixes = self._load_blacklist_prefixes()
+        self._blacklist_prefix_tuple = tuple(self.blacklist_prefixes)
         
         # Load file extensions for CID filtering from CSV (fallback to hardcoded)
         self.file_extensions = self._load_file_extensions()
+        # str.endswith takes a tuple - one C-level call checks every extension.
+        # Lowercased: they are matched against lowercased addresses
+        self._file_extension_suffixes = tuple(sorted({ext.lower() for ext in self.file_extensions}))
+        
+        # email -> extract_email verdict (see _is_business_email)
+        self._business_email_cache = {}
     
     def _load_blacklist_prefixes(self) -> list:
         """Load email blacklist prefixes from filter repository (CSV only - no fallback)"""
@@ -74,6 +100,29 @@ class RegexExtractor:
             self.logger.error(f"Failed to load file extensions from CSV: {str(e)} - using empty list")
             return []  # No hardcoded fallback - return empty list
     
+    def _is_business_email(self, email_lower: str) -> bool:
+        """Format, personal-domain and blacklisted-prefix checks for extract_email"""
+        # Quoted replies and signatures repeat the same addresses - check each once
+        verdict = self._business_email_cache.get(email_lower)
+        if verdict is not None:
+            return verdict
+        
+        # FIRST: Validate email format (filter out CID references)
+        if not self._is_valid_email_format(email_lower):
+            verdict = False
+        # Skip personal email domains (Gmail, Yahoo, etc.)
+        elif self._is_personal_email(email_lower):
+            self.logger.debug("Skipped personal email: %s", email_lower)
+            verdict = False
+        # Skip blacklisted prefixes (loaded from CSV)
+        else:
+            verdict = not email_lower.startswith(self._blacklist_prefix_tuple)
+        
+        if len(self._business_email_cache) >= 4096:
+            self._business_email_cache.clear()
+        self._business_email_cache[email_lower] = verdict
+        return verdict
+    
     def _is_personal_email(self, email: str) -> bool:
         """Check if email is from a personal/consumer domain using database filters"""
         if not email or '@' not in email:
@@ -89,71 +138,46 @@ class RegexExtractor:
         - Image CIDs: image001.png@01dc6e1f.089ef930
         - File references: document.pdf@server.com
         - Invalid formats with numbers/hex in domain
+        
+        Expects an already lowercased email (extract_email lowercases each match once)
         """
         if not email or '@' not in email:
             return False
         
-        try:
-            local_part, domain = email.split('@', 1)
-            
-            # Filter out file extensions in local part (loaded from CSV)
-            if any(local_part.lower().endswith(ext) for ext in self.file_extensions):
-                self.logger.debug(f"Filtered out image/file CID: {email}")
-                return False
-            
-            # Filter out hex-like domains (CID references like @01dc6e1f.089ef930)
-            # These typically have only numbers and hex characters
-            domain_parts = domain.split('.')
-            if all(all(c in '0123456789abcdef' for c in part.lower()) for part in domain_parts):
-                self.logger.debug(f"Filtered out CID reference: {email}")
-                return False
-            
-            # Domain should have at least one alphabetic character
-            if not any(c.isalpha() for c in domain):
-                self.logger.debug(f"Filtered out invalid domain: {email}")
-                return False
-            
-            # Domain should not be too short (minimum realistic: x.co = 4 chars)
-            if len(domain) < 4:
-                return False
-            
-            return True
-            
-        except:
+        # '@' is known to be present: partition can't fail and builds no list
+        local_part, _, domain = email.partition('@')
+        
+        # Filter out file extensions in local part (loaded from CSV)
+        if self._file_extension_suffixes and local_part.endswith(self._file_extension_suffixes):
+            self.logger.debug("Filtered out image/file CID: %s", email)
+            return False
+        
+        # Filter out hex-like domains (CID references like @01dc6e1f.089ef930)
+        # These typically have only numbers and hex characters
+        if self.hex_domain_pattern.fullmatch(domain):
+            self.logger.debug("Filtered out CID reference: %s", email)
+            return False
+        
+        # Domain should have at least one alphabetic character
+        if not self.alpha_pattern.search(domain):
+            self.logger.debug("Filtered out invalid domain: %s", email)
+            return False
+        
+        # Domain should not be too short (minimum realistic: x.co = 4 chars)
+        if len(domain) < 4:
             return False
+        
+        return True
     
     def extract_email(self, text: str) -> Optional[str]:
         """Extract email address from text, excluding personal emails (Gmail, Yahoo, etc.)"""
         try:
-            # Get all emails
-            emails = self.email_pattern.findall(text)
-            if not emails:
-                return None
-            
-            
-            valid_emails = []
-            for email in emails:
-                email_lower = email.lower()
-                
-                # FIRST: Validate email format (filter out CID references)
-                if not self._is_valid_email_format(email_lower):
-                    continue
-                
-                # Skip personal email domains (Gmail, Yahoo, etc.)
-                if self._is_personal_email(email_lower):
-                    self.logger.debug(f"Skipped personal email: {email_lower}")
-                    continue
-                
-                # Skip blacklisted prefixes (loaded from CSV)
-                if any(email_lower.startswith(prefix) for prefix in self.blacklist_prefixes):
-                    continue
-                    
-                valid_emails.append(email_lower)
-            
-            # Return first valid email
-            if valid_emails:
-                self.logger.debug(f"Extracted business email: {valid_emails[0]}")
-                return valid_emails[0]
+            # Return first valid email - matches are scanned lazily, so the rest
+            # of the text is never searched once one is found
+            for email_lower in self.iter_emails(text):
+                if self._is_business_email(email_lower):
+                    self.logger.debug("Extracted business email: %s", email_lower)
+                    return email_lower
             
             self.logger.debug("No valid business emails found")
             return None
@@ -162,10 +186,22 @@ class RegexExtractor:
             self.logger.error(f"Error extracting email: {str(e)}")
             return None
     
+    def iter_emails(self, text: str) -> Iterator[str]:
+        """Yield lowercased email addresses from text as they are matched"""
+        pos = 0
+        while True:
+            match = self._email_resume_pattern.match(text, pos) if pos else None
+            if match is None:
+                match = self.email_pattern.search(text, pos)
+                if match is None:
+                    return
+            yield match.group(0).lower()
+            pos = match.end()
+    
     def extract_all_emails(self, text: str) -> list:
         """Extract all email addresses from text"""
         try:
-            return [email.lower() for email in self.email_pattern.findall(text)]
+            return list(self.iter_emails(text))
         except Exception as e:
             self.logger.error(f"Error extracting emails: {str(e)}")
             return []
@@ -173,6 +209,10 @@ class RegexExtractor:
     def extract_phone(self, text: str, region: str = 'US') -> Optional[str]:
         """Extract and format phone number with fallback regions"""
         try:
+            # No digits, no phone number - skip building the matchers
+            if not self.digit_pattern.search(text):
+                return None
+            
             # Try US first
             for match in phonenumbers.PhoneNumberMatcher(text, region):
                 phone_number = match.number
@@ -213,3 +253,14 @@ class RegexExtractor:
         except Exception as e:
             self.logger.error(f"Error extracting LinkedIn URL: {str(e)}")
             return None
+
+
+# Singleton instance - the patterns and CSV lists are the same for every caller
+_regex_extractor = None
+
+def get_regex_extractor() -> RegexExtractor:
+    """Get global regex extractor instance"""
+    global _regex_extractor
+    if _regex_extractor is None:
+        _regex_extractor = RegexExtractor()
+    return _regex_extractor
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import joblib
 
@@ -24,8 +24,10 @@ class MLFilter:
             return False
 
         try:
-            self.classifier = joblib.load(classifier_path)
-            self.vectorizer = joblib.load(vectorizer_path)
+            # Memory-map the models' numpy arrays (read-only at inference) instead of
+            # copying them onto the heap; pages are shared between processes
+            self.classifier = joblib.load(classifier_path, mmap_mode="r")
+            self.vectorizer = joblib.load(vectorizer_path, mmap_mode="r")
             logger.info("ML classifier loaded from %s", self.model_dir)
             return True
         except Exception as error:
@@ -47,3 +49,25 @@ class MLFilter:
         except Exception as error:
             logger.error("ML classification failed: %s", error)
             return None
+
+    def predict_recruiter_batch(self, emails: List[Tuple[str, str, str]]) -> List[Optional[bool]]:
+        """Batched predict_recruiter over (subject, body, from_email) tuples.
+
+        One vectorizer/classifier call for all rows; every entry is None on inference failure.
+        """
+        if not emails:
+            return []
+        if not self.classifier or not self.vectorizer:
+            return [None] * len(emails)
+
+        try:
+            feature_texts = [
+                f"{subject or ''} {body or ''} {from_email or ''}"
+                for subject, body, from_email in emails
+            ]
+            features = self.vectorizer.transform(feature_texts)
+            predictions = self.classifier.predict(features)
+            return [bool(int(prediction) == 1) for prediction in predictions]
+        except Exception as error:
+            logger.error("ML batch classification failed: %s", error)
+            return [None] * len(emails)
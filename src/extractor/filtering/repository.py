@@ -7,6 +7,91 @@ from ..connectors.http_api import get_api_client
 
 logger = logging.getLogger(__name__)
 
+# Regex filter keywords come from the CSV/API, not from this codebase. Compile
+# them with the `regex` package (requirements.txt) when it is installed: it is
+# re-compatible and also accepts atomic groups and possessive quantifiers, so
+# a rule can be written not to backtrack on any Python version
+try:
+    import regex as _keyword_re
+except ImportError:
+    _keyword_re = re
+
+# A regex keyword that is just a literal (letters, digits, -, _, @ and escaped
+# dots), optionally anchored with ^ and/or $ (see FilterRepository._compile_matcher)
+_ANCHORED_LITERAL_RE = re.compile(r'(?P<start>\^)?(?P<text>(?:[a-zA-Z0-9_@-]|\\\.)+)(?P<end>\$)?')
+
+
+def _strip_dot_star(keyword: str) -> str:
+    """Drop a leading (^).* and a trailing .*($) from a regex filter keyword
+
+    For a search over a single-line email these only widen the match span,
+    never whether it matches, but the engine retries the rest of the pattern
+    at every offset. Keywords with alternation are left alone.
+    """
+    if '|' in keyword:
+        return keyword
+    stripped = keyword
+    for lead in ('^.*', '.*'):
+        if stripped.startswith(lead):
+            stripped = stripped[len(lead):]
+            break
+    for tail in ('.*$', '.*'):
+        if stripped.endswith(tail):
+            head = stripped[:-len(tail)]
+            # The dot must not be escaped (an odd run of backslashes before it)
+            if (len(head) - len(head.rstrip('\\'))) % 2 == 0:
+                stripped = head
+            break
+    # Nothing left, or a quantifier now leads (.*? / .** / .*{2}): keep as written
+    if not stripped or stripped[0] in '*+?{':
+        return keyword
+    return stripped
+
+
+# A global inline flag group such as (?x) or (?is) - scoped (?i:...) groups are fine
+_INLINE_GLOBAL_FLAGS_RE = re.compile(r'\(\?[aiLmsux]+\)')
+
+
+def compile_pattern_union(patterns: List[str], engine=_keyword_re) -> List:
+    """Compile "does any of these match" patterns into as few regexes as possible
+
+    Invalid patterns never matched before and are dropped. Patterns with
+    groups (backreferences/named groups would be renumbered or collide) or
+    inline global flags (which would apply to the whole alternation) stay
+    separate; the rest are fused into one IGNORECASE alternation, or kept
+    individual if the union itself fails to compile.
+    """
+    fusable = []
+    separate = []
+    for pattern in patterns:
+        try:
+            compiled = engine.compile(pattern, engine.IGNORECASE)
+        except engine.error as e:
+            logger.warning(f"Skipping invalid filter regex '{pattern}': {str(e)}")
+            continue
+        if compiled.groups or _INLINE_GLOBAL_FLAGS_RE.search(pattern):
+            separate.append(compiled)
+        else:
+            fusable.append((pattern, compiled))
+    
+    if len(fusable) > 1:
+        try:
+            union = engine.compile('|'.join(f'(?:{pattern})' for pattern, _ in fusable), engine.IGNORECASE)
+            return [union] + separate
+        except engine.error:
+            pass
+    return [compiled for _, compiled in fusable] + separate
+
+
+# Local-part shapes of autogenerated/bot senders (see FilterRepository._is_dynamic_junk)
+_UUID_LOCAL_RE = re.compile(r'^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$')
+_HASH_LOCAL_RE = re.compile(r'^[a-f0-9]{32,}$')
+_PLUS_TRACKING_RE = re.compile(r'\+[a-z0-9]+\+[a-f0-9]{10,}')
+_DESK_LOCAL_RE = re.compile(r'^(screening|hiring|recruiting|talent)desk\.')
+_HEX_RUN_RE = re.compile(r'[a-f0-9]{12,}')
+_BOT_PREFIX_RE = re.compile(r'^(?:v|tr|ref|id|cid|bounce|u|s|ext)-[0-9]+')
+_LETTERS_DIGITS_RE = re.compile(r'^[a-z]{3,}[0-9]{3,}$')
+
 class FilterRepository:
     """Repository for loading and caching email filters from database"""
     
@@ -14,6 +99,13 @@ class FilterRepository:
         self.logger = logging.getLogger(__name__)
         self._filters = None
         self._filters_by_priority = None
+        # Precompiled allowed_/blocked_ rules for check_email (see _get_email_rules)
+        self._email_rules = None
+        # Normalized email -> check_email verdict; senders repeat across a mailbox
+        # and several extractors check the same addresses
+        self._email_verdicts = {}
+        # Category -> split keyword list (see get_keyword_lists)
+        self._keyword_lists = None
         
     def load_filters(self) -> bool:
         """Load filters from CSV first, fallback to API if CSV not available"""
@@ -66,6 +158,9 @@ class FilterRepository:
                         })
             
             self._filters = filters
+            self._email_rules = None
+            self._email_verdicts = {}
+            self._keyword_lists = None
             
             # Sort by priority (lower number = higher priority)
             self._filters.sort(key=lambda x: x.get('priority', 999))
@@ -104,6 +199,9 @@ class FilterRepository:
                 f for f in all_filters 
                 if f.get('is_active') == 1 and f.get('source') == 'email_extractor'
             ]
+            self._email_rules = None
+            self._email_verdicts = {}
+            self._keyword_lists = None
             
             # Sort by priority (lower number = higher priority)
             self._filters.sort(key=lambda x: x.get('priority', 999))
@@ -147,68 +245,140 @@ class FilterRepository:
         if not email:
             return None
         
-        filters = self.get_filters()
         email_lower = email.lower()
         
-        # Extract parts for different matching strategies
+        # Single lookup: worker threads share this memo, and a concurrent
+        # clear() can land between an 'in' test and the subscript
         try:
-            local_part, domain = email_lower.split('@', 1)
-        except:
+            return self._email_verdicts[email_lower]
+        except KeyError:
+            pass
+        
+        action = self._check_email_uncached(email_lower)
+        if len(self._email_verdicts) >= 4096:
+            self._email_verdicts.clear()
+        self._email_verdicts[email_lower] = action
+        return action
+    
+    def _check_email_uncached(self, email_lower: str) -> Optional[str]:
+        """Run the filters and dynamic heuristics for a lowercased email (see check_email)"""
+        # Extract parts for different matching strategies
+        if '@' not in email_lower:
             return 'block'  # Invalid email format
+        local_part, _, domain = email_lower.partition('@')
         
-        # Process filters in priority order
-        for filter_item in filters:
-            category = filter_item.get('category', '')
-            keywords_str = filter_item.get('keywords', '')
-            match_type = filter_item.get('match_type', 'contains')
-            action = filter_item.get('action', 'block')
-            
-            # ... (filtering logic for allowed_/blocked_ categories)
-            if not (category.startswith('allowed_') or category.startswith('blocked_')):
-                continue
-
-            if not keywords_str:
-                continue
-            
-            # ... (target selection)
-            cat_lower = category.lower()
-            if any(k in cat_lower for k in ['localpart', 'prefix', 'density', 'random']):
-                match_target = local_part
-            elif 'domain' in cat_lower:
-                match_target = domain
-            elif 'email' in cat_lower:
-                match_target = email_lower
-            else:
-                match_target = email_lower
-            
-            # Check each keyword
-            keywords = [k.strip() for k in keywords_str.split(',') if k.strip()]
-            for keyword in keywords:
-                if self._matches(match_target, keyword, match_type):
-                    self.logger.debug(f"Filter matched: {category} - {keyword} -> {action}")
-                    return action
+        # Process filters in priority order (one precompiled matcher per filter)
+        targets = (local_part, domain, email_lower)
+        for category, action, target, find in self._get_email_rules():
+            keyword = find(targets[target])
+            if keyword is not None:
+                self.logger.debug("Filter matched: %s - %s -> %s", category, keyword, action)
+                return action
         
         # Finally, run dynamic heuristic checks for auto-generated/marketing bots
         if self._is_dynamic_junk(local_part, domain):
-            self.logger.info(f"Dynamic junk detected: {email}")
+            self.logger.info(f"Dynamic junk detected: {email_lower}")
             return 'block'
 
         return None  # No match
     
-    def _matches(self, text: str, pattern: str, match_type: str) -> bool:
-        """Check if text matches pattern based on match_type"""
-        try:
-            if match_type == 'exact':
-                return text == pattern.lower()
-            elif match_type == 'contains':
-                return pattern.lower() in text
-            elif match_type == 'regex':
-                return bool(re.search(pattern, text, re.IGNORECASE))
-            else:
-                return False
-        except Exception:
-            return False
-
+    def _get_email_rules(self) -> List[tuple]:
+        """Get the allowed_/blocked_ filters compiled for check_email, in priority order
+        
+        Each rule is (category, action, target, find): target indexes
+        (local_part, domain, email) and find(text) returns the matched
+        keyword or None. Keyword strings are split and compiled once per
+        filter load instead of once per checked email.
+        """
+        if self._email_rules is None:
+            rules = []
+            for filter_item in self.get_filters():
+                category = filter_item.get('category', '')
+                keywords_str = filter_item.get('keywords', '')
+                match_type = filter_item.get('match_type', 'contains')
+                action = filter_item.get('action', 'block')
+                
+                if not (category.startswith('allowed_') or category.startswith('blocked_')):
+                    continue
+                
+                keywords = [k.strip() for k in keywords_str.split(',') if k.strip()] if keywords_str else []
+                find = self._compile_matcher(keywords, match_type) if keywords else None
+                if find is None:
+                    continue
+                
+                # Target selection
+                cat_lower = category.lower()
+                if any(k in cat_lower for k in ['localpart', 'prefix', 'density', 'random']):
+                    target = 0  # local part
+                elif 'domain' in cat_lower:
+                    target = 1  # domain
+                else:
+                    target = 2  # full email
+                
+                rules.append((category, action, target, find))
+            self._email_rules = rules
+        return self._email_rules
+    
+    def _compile_matcher(self, keywords: List[str], match_type: str):
+        """Compile one filter's keywords into find(text) -> matched keyword or None"""
+        exact = frozenset()
+        prefixes = ()
+        suffixes = ()
+        substrings = ()
+        patterns = []
+        
+        if match_type == 'exact':
+            exact = frozenset(k.lower() for k in keywords)
+        elif match_type == 'contains':
+            # One alternation scan instead of a substring test per keyword
+            ordered = sorted({k.lower() for k in keywords}, key=len, reverse=True)
+            patterns = [re.compile('|'.join(map(re.escape, ordered)))]
+        elif match_type == 'regex':
+            # Literals (gmail\.com$, ^noreply, ^x\.com$, .*alert.* - most rules)
+            # are plain string tests; only real patterns need the regex engine
+            exact_set, prefix_set, suffix_set, substring_set = set(), set(), set(), set()
+            regexes = []
+            for keyword in keywords:
+                keyword = _strip_dot_star(keyword)
+                literal = _ANCHORED_LITERAL_RE.fullmatch(keyword)
+                if not literal:
+                    regexes.append(keyword)
+                    continue
+                text = literal.group('text').replace('\\.', '.').lower()
+                if literal.group('start') and literal.group('end'):
+                    exact_set.add(text)
+                elif literal.group('end'):
+                    suffix_set.add(text)
+                elif literal.group('start'):
+                    prefix_set.add(text)
+                else:
+                    substring_set.add(text)
+            exact = frozenset(exact_set)
+            prefixes = tuple(prefix_set)
+            suffixes = tuple(suffix_set)
+            substrings = tuple(substring_set)
+            patterns = compile_pattern_union(regexes)
+        
+        if not (exact or prefixes or suffixes or substrings or patterns):
+            return None
+        
+        def find(text: str) -> Optional[str]:
+            if text in exact:
+                return text
+            if suffixes and text.endswith(suffixes):
+                return next(s for s in suffixes if text.endswith(s))
+            if prefixes and text.startswith(prefixes):
+                return next(p for p in prefixes if text.startswith(p))
+            for substring in substrings:
+                if substring in text:
+                    return substring
+            for pattern in patterns:
+                match = pattern.search(text)
+                if match:
+                    return match.group(0)
+            return None
+        return find
+    
     def _is_dynamic_junk(self, local_part: str, domain: str) -> bool:
         """Heuristic check for autogenerated/bot emails"""
         
@@ -216,32 +386,32 @@ class FilterRepository:
         
         # 1. UUID pattern (8-4-4-4-12 hex with dashes)
         # Example: d45493db-1629-4a02-affb-11f17d2500f6@reply.linkedin.com
-        if re.match(r'^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$', local_part):
+        if _UUID_LOCAL_RE.match(local_part):
             self.logger.info(f"Dynamic junk: UUID pattern detected in {local_part}")
             return True
         
         # 2. Pure MD5/SHA hash (32+ consecutive hex chars)
         # Example: bb2137b38d8f4e81beb7fecf9d1785a6@integrisit.com
-        if re.match(r'^[a-f0-9]{32,}$', local_part):
+        if _HASH_LOCAL_RE.match(local_part):
             self.logger.info(f"Dynamic junk: MD5/SHA hash detected in {local_part}")
             return True
         
         # 3. Reply tracking patterns (reply-, reply+)
         # Example: reply-z7q4xsbuyvcu7efu4ax2erfhjy.100217@hello.email.hays.com
         # Example: reply+2v4hf0&78gig8&&aa1a5...@mg1.substack.com
-        if re.match(r'^reply[-+]', local_part):
+        if local_part.startswith(('reply-', 'reply+')):
             self.logger.info(f"Dynamic junk: Reply tracking pattern detected in {local_part}")
             return True
         
         # 4. Plus-based tracking (email+tracking+hash)
         # Example: publicisgroupe+email+10pv7-14b808175a@talent.icims.eu
-        if re.search(r'\+[a-z0-9]+\+[a-f0-9]{10,}', local_part):
+        if _PLUS_TRACKING_RE.search(local_part):
             self.logger.info(f"Dynamic junk: Plus-based tracking detected in {local_part}")
             return True
         
         # 5. Desk patterns (screeningdesk.company, hiringdesk.company)
         # Example: screeningdesk.intuit@outlook.com
-        if re.match(r'^(screening|hiring|recruiting|talent)desk\.', local_part):
+        if _DESK_LOCAL_RE.match(local_part):
             self.logger.info(f"Dynamic junk: Desk pattern detected in {local_part}")
             return True
         
@@ -263,12 +433,12 @@ class FilterRepository:
         
         # 8. Random hex/hash strings (8+ chars of 0-9a-f)
         # Often used by tracking/reply systems
-        if re.search(r'[a-f0-9]{12,}', local_part):
+        if _HEX_RUN_RE.search(local_part):
             return True
             
         # 9. Known bot prefixes followed by numbers
         # v-123..., tr-123..., id-123...
-        if re.match(r'^(?:v|tr|ref|id|cid|bounce|u|s|ext)-[0-9]+', local_part):
+        if _BOT_PREFIX_RE.match(local_part):
             return True
             
         # 10. Excessive subdomains (bot-like domain nesting)
@@ -276,28 +446,34 @@ class FilterRepository:
             return True
             
         # 11. Generic bot pattern: letters + numbers at the end
-        if re.match(r'^[a-z]{3,}[0-9]{3,}$', local_part):
+        if _LETTERS_DIGITS_RE.match(local_part):
             return True
 
         return False
 
 
     def get_keyword_lists(self) -> Dict[str, List[str]]:
-        """Get keyword lists organized by category for backward compatibility"""
-        filters = self.get_filters()
-        result = {}
+        """Get keyword lists organized by category for backward compatibility
         
-        for filter_item in filters:
-            category = filter_item.get('category', '')
-            keywords_str = filter_item.get('keywords', '')
-            
-            if keywords_str:
-                keywords = [k.strip() for k in keywords_str.split(',') if k.strip()]
-                if category not in result:
-                    result[category] = []
-                result[category].extend(keywords)
+        Keyword strings are split once per filter load; every extractor asks
+        for these at init, so callers get fresh list copies of the cached split.
+        """
+        if self._keyword_lists is None:
+            result = {}
+            for filter_item in self.get_filters():
+                category = filter_item.get('category', '')
+                keywords_str = filter_item.get('keywords', '')
+                
+                if keywords_str:
+                    keywords = [k.strip() for k in keywords_str.split(',') if k.strip()]
+                    if category not in result:
+                        result[category] = []
+                    result[category].extend(keywords)
+            if self._filters is None:
+                return result  # Load failed; retry on the next call
+            self._keyword_lists = result
         
-        return result
+        return {category: list(keywords) for category, keywords in self._keyword_lists.items()}
 
 
 # Singleton instance
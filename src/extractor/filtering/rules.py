@@ -6,6 +6,9 @@ from ..filtering.ml_filter import MLFilter
 
 logger = logging.getLogger(__name__)
 
+# Address in a From header: <addr>, (addr) or the bare header
+_HEADER_EMAIL_RE = re.compile(r'(?:<|\(|^)([\w\.-]+@[\w\.-]+)(?:>|\)|$)', re.IGNORECASE)
+
 class EmailFilter:
     """Filter and classify emails (recruiter vs junk)"""
     
@@ -23,6 +26,9 @@ class EmailFilter:
         self.recruiter_keywords = keyword_lists.get('recruiter_keywords', [])
         self.anti_recruiter_keywords = keyword_lists.get('anti_recruiter_keywords', [])
         
+        # From header -> cleaned address; the same senders recur across a mailbox
+        self._header_emails = {}
+        
         # Load ML classifier if enabled
         self.use_ml = config.get('filters', {}).get('use_ml_classifier', False)
         self.ml_filter = None
@@ -51,34 +57,37 @@ class EmailFilter:
         """Rule-only recruiter classifier."""
         subject_lower = (subject or "").lower()
         body_lower = (body or "").lower()
-        text = f"{subject_lower} {body_lower}"
 
-        anti_keyword_count = sum(1 for kw in self.anti_recruiter_keywords if kw in text)
-        if anti_keyword_count >= 4:
-            return False
+        # Stop counting anti-keywords as soon as the threshold is reached; with
+        # fewer than 4 anti-keywords configured the threshold can never be met
+        if len(self.anti_recruiter_keywords) >= 4:
+            text = f"{subject_lower} {body_lower}"
+            anti_keyword_count = 0
+            for kw in self.anti_recruiter_keywords:
+                if kw in text:
+                    anti_keyword_count += 1
+                    if anti_keyword_count >= 4:
+                        return False
 
-        subject_keyword_count = sum(1 for kw in self.recruiter_keywords if kw in subject_lower)
-        body_keyword_count = sum(1 for kw in self.recruiter_keywords if kw in body_lower)
-
-        if subject_keyword_count >= 1:
-            return True
-        if body_keyword_count >= 2:
+        # Subject >= 1, body >= 2 or any hit at all: together a single keyword
+        # in subject or body decides, so stop at the first one found
+        if any(kw in subject_lower for kw in self.recruiter_keywords):
             return True
-        if subject_keyword_count + body_keyword_count >= 1:
-            return True
-        return False
+        return any(kw in body_lower for kw in self.recruiter_keywords)
     
     def _extract_clean_email(self, from_header: str) -> str:
         """Extract email address from From header"""
         if not from_header:
             return ""
         
-        email_match = re.search(
-            r'(?:<|\(|^)([\w\.-]+@[\w\.-]+)(?:>|\)|$)',
-            from_header,
-            re.IGNORECASE
-        )
-        return email_match.group(1).lower() if email_match else ""
+        email = self._header_emails.get(from_header)
+        if email is None:
+            email_match = _HEADER_EMAIL_RE.search(from_header)
+            email = email_match.group(1).lower() if email_match else ""
+            if len(self._header_emails) >= 4096:
+                self._header_emails.clear()
+            self._header_emails[from_header] = email
+        return email
     
     def is_junk_email(self, from_header: str) -> bool:
         """Check if email is junk/automated/system using database filters"""
@@ -91,10 +100,10 @@ class EmailFilter:
         action = self.filter_repo.check_email(email)
         
         if action == 'block':
-            self.logger.debug(f"Blocked by filter: {email}")
+            self.logger.debug("Blocked by filter: %s", email)
             return True
         elif action == 'allow':
-            self.logger.debug(f"Allowed by filter: {email}")
+            self.logger.debug("Allowed by filter: %s", email)
             return False
         
         # No match - default to not junk
@@ -106,6 +115,10 @@ class EmailFilter:
         if self.is_junk_email(from_email):
             return False
         
+        return self._classify_recruiter(subject, body, from_email)
+    
+    def _classify_recruiter(self, subject: str, body: str, from_email: str) -> bool:
+        """Recruiter classification for an email already known not to be junk"""
         # If ML classifier available, use it
         if self.use_ml:
             ml_result = self._classify_with_ml(subject, body, from_email)
@@ -114,9 +127,16 @@ class EmailFilter:
 
         return self._classify_with_rules(subject, body)
     
-    def is_calendar_invite(self, email_message) -> bool:
-        """Check if email is a calendar invite"""
+    def is_calendar_invite(self, email_message, parts: Dict[str, List] = None) -> bool:
+        """Check if email is a calendar invite (parts: EmailCleaner.index_parts of it, if built)"""
         try:
+            # A single-part message is its own only part - no tree walk needed
+            if not email_message.is_multipart():
+                return email_message.get_content_type() == "text/calendar"
+            
+            if parts is not None:
+                return "text/calendar" in parts
+            
             for part in email_message.walk():
                 if part.get_content_type() == "text/calendar":
                     return True
@@ -142,16 +162,28 @@ class EmailFilter:
         not_recruiter_count = 0
         calendar_count = 0
         
+        # Loop-invariant: read the calendar setting once, not per email
+        include_calendar_invites = self.config.get('processing', {}).get('calendar_invites', {}).get('process', True)
+        
+        # With the ML classifier, recruiter decisions are made after the loop in one
+        # batched vectorizer/classifier call: (position in filtered, subject, body, from)
+        use_ml_batch = self.use_ml and self.ml_filter is not None
+        ml_pending = []
+        
         for email_data in emails:
             try:
                 msg = email_data['message']
                 from_header = msg.get('From', '')
-                subject = msg.get('Subject', '')
+                
+                # One MIME walk shared by the calendar check and body extraction
+                parts = None
                 
                 # Always include calendar invites
-                if self.config.get('processing', {}).get('calendar_invites', {}).get('process', True):
-                    if self.is_calendar_invite(msg):
-                        self.logger.debug(f"Including calendar invite from {from_header}")
+                if include_calendar_invites:
+                    if msg.is_multipart():
+                        parts = cleaner.index_parts(msg)
+                    if self.is_calendar_invite(msg, parts):
+                        self.logger.debug("Including calendar invite from %s", from_header)
                         calendar_count += 1
                         filtered.append(email_data)
                         continue
@@ -161,11 +193,17 @@ class EmailFilter:
                     junk_count += 1
                     continue
                 
-                # Extract and clean body
-                body = cleaner.extract_body(msg)
+                # Only emails that survive the junk check need the subject and body
+                subject = msg.get('Subject', '')
+                body = cleaner.extract_body(msg, parts)
+                
+                if use_ml_batch:
+                    ml_pending.append((len(filtered), subject, body, from_header))
+                    filtered.append(email_data)
+                    continue
                 
-                # Check if recruiter email
-                if self.is_recruiter_email(subject, body, from_header):
+                # Check if recruiter email (junk was ruled out above)
+                if self._classify_recruiter(subject, body, from_header):
                     email_data['clean_body'] = body
                     filtered.append(email_data)
                 else:
@@ -175,6 +213,23 @@ class EmailFilter:
                 self.logger.error(f"Error filtering email: {str(e)}")
                 continue
         
+        if ml_pending:
+            predictions = self.ml_filter.predict_recruiter_batch(
+                [(subject, body, from_header) for _, subject, body, from_header in ml_pending]
+            )
+            rejected = set()
+            for (position, subject, body, _), is_recruiter in zip(ml_pending, predictions):
+                # Same fallback as _classify_recruiter when inference fails
+                if is_recruiter is None:
+                    is_recruiter = self._classify_with_rules(subject, body)
+                if is_recruiter:
+                    filtered[position]['clean_body'] = body
+                else:
+                    rejected.add(position)
+            if rejected:
+                not_recruiter_count += len(rejected)
+                filtered = [email_data for position, email_data in enumerate(filtered) if position not in rejected]
+        
         # Build filter statistics
         filter_stats = {
             'total': len(emails),
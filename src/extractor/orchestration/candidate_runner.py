@@ -62,7 +62,6 @@ class CandidateRunner:
         vendor_util,
         connector_cls=GmailIMAPConnector,
         reader_cls=EmailReader,
-        deduplication_cache=None,
     ):
         self.config = config
         self.cleaner = cleaner
@@ -72,7 +71,6 @@ class CandidateRunner:
         self.vendor_util = vendor_util
         self.connector_cls = connector_cls
         self.reader_cls = reader_cls
-        self.deduplication_cache = deduplication_cache
         self.logger = logging.getLogger(__name__)
 
     def run(self, candidate: Dict) -> CandidateRunResult:
@@ -163,6 +161,12 @@ class CandidateRunner:
                 for key in filter_stats:
                     filter_stats[key] += int(batch_stats.get(key, 0))
 
+                # Batch the NER model over every body up front; the per-email
+                # extraction below then reads the cached entities
+                self.extractor.prefetch_entities(
+                    [email_data["clean_body"] for email_data in filtered_emails if email_data.get("clean_body")]
+                )
+
                 for email_data in filtered_emails:
                     try:
                         message = email_data["message"]
@@ -192,17 +196,10 @@ class CandidateRunner:
                             contact["extracted_from_uid"] = email_data.get("uid")
                             contact["candidate_id"] = candidate_id  # tag for bulk save
 
-                            # Intra-run global deduplication cache (across candidates)
-                            if self.deduplication_cache and self.deduplication_cache.is_seen_in_run(contact_email):
-                                deduplicated_count += 1
-                                self.logger.info(f"Skipping intra-run duplicate: {contact_email}")
-                                continue
-
+                            # Cross-candidate dedupe happens in the service, in
+                            # candidate order, once every worker has returned
                             extracted_contacts.append(contact)
 
-                            if self.deduplication_cache:
-                                self.deduplication_cache.mark_seen_in_run(contact_email)
-
                     except Exception as extraction_error:
                         self.logger.error(
                             "Error extracting candidate_id=%s email=%s uid=%s: %s",
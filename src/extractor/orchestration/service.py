@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -105,7 +106,6 @@ class EmailExtractionService:
             extractor=self.extractor,
             email_filter=self.email_filter,
             uid_tracker=self.uid_tracker,
-            deduplication_cache=self.deduplication_cache,
             vendor_util=self.vendor_util,
             connector_cls=GmailIMAPConnector,
             reader_cls=EmailReader,
@@ -180,6 +180,7 @@ class EmailExtractionService:
             # in this run (handles duplicate DB rows for the same inbox).
             seen_candidate_emails: set = set()
 
+            candidates_to_run = []
             for candidate in candidates:
                 cand_email = (candidate.get("email") or "").strip().lower()
                 if cand_email and cand_email in seen_candidate_emails:
@@ -191,8 +192,25 @@ class EmailExtractionService:
                     continue
                 if cand_email:
                     seen_candidate_emails.add(cand_email)
+                candidates_to_run.append(candidate)
+
+            # Each inbox is mostly IMAP/API wait, so candidates run on a thread
+            # pool (own IMAP connection each); results come back in input order.
+            # Workers share one extractor/filter (one copy of the NER models), so
+            # their memos use single lookups or a lock rather than check-then-get
+            max_workers = max(1, int(self.config.get("email", {}).get("max_workers", 4)))
+            self.logger.info(
+                "Processing %d candidates with %d workers",
+                len(candidates_to_run),
+                min(max_workers, len(candidates_to_run)),
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self.candidate_runner.run, candidates_to_run))
 
-                result = self.candidate_runner.run(candidate)
+            # Claim contacts across candidates in input order, not as workers
+            # finish, so the same input always credits the same candidate
+            for result in results:
+                self._claim_run_contacts(result)
                 candidate_results.append(result)
                 execution_metadata["candidates"].append(result.to_metadata())
                 total_emails_fetched += result.emails_fetched
@@ -358,6 +376,24 @@ class EmailExtractionService:
             self.email_reporter.send_report(report)
             raise
 
+    def _claim_run_contacts(self, result):
+        """Drop contacts an earlier candidate in this run already claimed"""
+        if not self.deduplication_cache:
+            return
+        kept = []
+        for contact in result.extracted_contacts:
+            contact_email = (contact.get("email") or "").strip().lower()
+            if not self.deduplication_cache.claim_in_run(contact_email):
+                result.duplicates_skipped += 1
+                result.contacts_deduplicated += 1
+                self.logger.info(f"Skipping intra-run duplicate: {contact_email}")
+                continue
+            kept.append(contact)
+        result.extracted_contacts = kept
+        if result.status == "success":
+            result.contacts_saved = len(kept)
+            result.positions_saved = len(kept)
+
     def _update_run_status(
         self,
         status: str,
@@ -1,5 +1,6 @@
 from typing import Set, Optional
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,8 @@ class DeduplicationCache:
         self.seen_emails_run: Set[str] = set()
         self.known_db_emails: Set[str] = set()
         self._db_cache_populated = False
+        # Candidates run on worker threads (see claim_in_run)
+        self._run_lock = threading.Lock()
 
     def is_seen_in_run(self, email: str) -> bool:
         """Check if an email has already been processed in the current run."""
@@ -34,6 +37,22 @@ class DeduplicationCache:
         if email:
             self.seen_emails_run.add(email.strip().lower())
 
+    def claim_in_run(self, email: str) -> bool:
+        """
+        Mark an email as processed in the current run unless it already was.
+
+        Atomic check-and-mark, so two candidates processed concurrently cannot
+        both keep the same contact. Returns True if the caller claimed it.
+        """
+        if not email:
+            return True
+        email = email.strip().lower()
+        with self._run_lock:
+            if email in self.seen_emails_run:
+                return False
+            self.seen_emails_run.add(email)
+            return True
+
     def add_known_db_emails(self, emails: Set[str]):
         """Add a batch of known emails from the database to the cache."""
         normalized = {e.strip().lower() for e in emails if e}
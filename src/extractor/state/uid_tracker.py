@@ -9,6 +9,7 @@ backend API, so that we never re-process emails already handled.
 
 import json
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -41,6 +42,8 @@ class UIDTracker:
         self.tracker_file = Path(tracker_file)
         self.api_client = api_client
         self.workflow_id = workflow_id
+        # Candidates run on worker threads; guards self.data and the file write
+        self._lock = threading.RLock()
         self.data = self._load()
         self.logger = logging.getLogger(__name__)
 
@@ -151,7 +154,7 @@ class UIDTracker:
         """Save last run data to JSON file"""
         try:
             self.tracker_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.tracker_file, "w") as f:
+            with self._lock, open(self.tracker_file, "w") as f:
                 json.dump(self.data, f, indent=2, sort_keys=True)
             logger.debug("Saved last_run.json with %d accounts", len(self.data))
         except Exception as e:
@@ -197,32 +200,33 @@ class UIDTracker:
             logger.warning("Invalid UID format for update: %s for %s", uid, email)
             return
 
-        current_data = self.data.get(email)
-        if current_data:
-            last_uid_str = current_data.get("last_uid")
-            try:
-                if last_uid_str and int(last_uid_str) > new_uid_int:
-                    # Stored UID is strictly higher — don't regress it,
-                    # but still refresh the last_run timestamp if forced.
-                    if force_timestamp:
-                        self.data[email]["last_run"] = datetime.now().isoformat()
-                        self._save()
-                        logger.debug("Updated timestamp only for %s (UID not advanced)", email)
-                    else:
-                        logger.debug(
-                            "Skipping UID update for %s: stored %s > new %s",
-                            email, last_uid_str, uid,
-                        )
-                    return
-            except (ValueError, TypeError):
-                pass  # Corrupted stored UID — allow overwrite
-
-        self.data[email] = {
-            "last_uid": str(uid),
-            "last_run": datetime.now().isoformat(),
-        }
-        self._save()
-        logger.info("Updated %s: last_uid=%s", email, uid)
+        with self._lock:
+            current_data = self.data.get(email)
+            if current_data:
+                last_uid_str = current_data.get("last_uid")
+                try:
+                    if last_uid_str and int(last_uid_str) > new_uid_int:
+                        # Stored UID is strictly higher — don't regress it,
+                        # but still refresh the last_run timestamp if forced.
+                        if force_timestamp:
+                            self.data[email]["last_run"] = datetime.now().isoformat()
+                            self._save()
+                            logger.debug("Updated timestamp only for %s (UID not advanced)", email)
+                        else:
+                            logger.debug(
+                                "Skipping UID update for %s: stored %s > new %s",
+                                email, last_uid_str, uid,
+                            )
+                        return
+                except (ValueError, TypeError):
+                    pass  # Corrupted stored UID — allow overwrite
+
+            self.data[email] = {
+                "last_uid": str(uid),
+                "last_run": datetime.now().isoformat(),
+            }
+            self._save()
+            logger.info("Updated %s: last_uid=%s", email, uid)
 
     def get_all_tracked_accounts(self) -> list:
         """Get list of all tracked email accounts"""
@@ -231,10 +235,11 @@ class UIDTracker:
     def remove_account(self, email: str):
         """Remove tracking for an account (forces full re-process next run)"""
         email = email.strip().lower()
-        if email in self.data:
-            del self.data[email]
-            self._save()
-            logger.info("Removed tracking for %s", email)
+        with self._lock:
+            if email in self.data:
+                del self.data[email]
+                self._save()
+                logger.info("Removed tracking for %s", email)
 
     def get_stats(self) -> Dict:
         """Get statistics about tracked accounts"""
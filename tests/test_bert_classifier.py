@@ -0,0 +1,90 @@
+"""
+Tests for BertJobClassifier.batch_classify with a stand-in pipeline callable.
+
+    python -m pytest tests/test_bert_classifier.py -v
+"""
+
+import logging
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+try:
+    from extractor.extraction.bert_classifier import BertJobClassifier
+except ImportError as e:  # needs torch and transformers
+    BertJobClassifier = None
+    _import_error = str(e)
+else:
+    _import_error = ""
+
+
+class FakeBinaryPipeline:
+    """Text-classification pipeline stand-in: 'junk' in the text -> LABEL_1"""
+
+    def __init__(self, fail_batches=False):
+        self.fail_batches = fail_batches
+        self.calls = []
+
+    def _output(self, text):
+        if 'boom' in text:
+            raise ValueError("bad input")
+        if 'junk' in text:
+            return {'label': 'LABEL_1', 'score': 0.9}
+        return {'label': 'LABEL_0', 'score': 0.8}
+
+    def __call__(self, inputs, batch_size=None):
+        self.calls.append(inputs)
+        if isinstance(inputs, str):
+            return [self._output(inputs)]
+        if self.fail_batches:
+            raise RuntimeError("batch failed")
+        return [self._output(text) for text in inputs]
+
+
+def _classifier(pipeline):
+    classifier = BertJobClassifier.__new__(BertJobClassifier)
+    classifier.logger = logging.getLogger(__name__)
+    classifier.threshold = 0.5
+    classifier.model_type = "binary"
+    classifier.classifier = pipeline
+    classifier._result_cache = {}
+    return classifier
+
+
+@unittest.skipIf(BertJobClassifier is None, f"bert_classifier unavailable: {_import_error}")
+class TestBatchClassify(unittest.TestCase):
+
+    def test_results_follow_input_order_with_empty_slots(self):
+        pipeline = FakeBinaryPipeline()
+        results = _classifier(pipeline).batch_classify(["Java developer", "", "junk mail", None])
+        self.assertEqual([r['label'] for r in results], ['valid', 'empty', 'junk', 'empty'])
+        self.assertEqual(pipeline.calls, [["Java developer", "junk mail"]])
+
+    def test_duplicates_and_repeats_hit_the_model_once(self):
+        pipeline = FakeBinaryPipeline()
+        classifier = _classifier(pipeline)
+        first = classifier.batch_classify(["Java developer", "Java developer", "junk mail"])
+        second = classifier.batch_classify(["junk mail", "Data engineer"])
+        self.assertEqual(pipeline.calls, [["Java developer", "junk mail"], ["Data engineer"]])
+        self.assertEqual([r['label'] for r in first], ['valid', 'valid', 'junk'])
+        self.assertEqual([r['label'] for r in second], ['junk', 'valid'])
+        # Every slot gets its own dict
+        first[0]['label'] = 'changed'
+        self.assertEqual(first[1]['label'], 'valid')
+        self.assertEqual(classifier.batch_classify(["Java developer"])[0]['label'], 'valid')
+
+    def test_failed_batch_falls_back_to_one_call_per_text(self):
+        pipeline = FakeBinaryPipeline(fail_batches=True)
+        classifier = _classifier(pipeline)
+        results = classifier.batch_classify(["Java developer", "boom", "junk mail"])
+        self.assertEqual([r['label'] for r in results], ['valid', 'error', 'junk'])
+        # Errors are not cached, so the bad text is retried next time
+        self.assertNotIn("boom", classifier._result_cache)
+        self.assertIn("Java developer", classifier._result_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
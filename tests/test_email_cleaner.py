@@ -0,0 +1,98 @@
+"""
+Tests for EmailCleaner body extraction from multipart messages.
+
+    python -m pytest tests/test_email_cleaner.py -v
+"""
+
+import os
+import sys
+import unittest
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+try:
+    from extractor.email.cleaner import EmailCleaner
+except ImportError as e:  # needs bs4
+    EmailCleaner = None
+    _cleaner_error = str(e)
+else:
+    _cleaner_error = ""
+
+try:
+    from extractor.filtering.rules import EmailFilter
+except ImportError as e:  # needs httpx and the ML filter dependencies
+    EmailFilter = None
+    _filter_error = str(e)
+else:
+    _filter_error = ""
+
+
+def _message(*parts):
+    """multipart/mixed message with one (subtype, text) part per argument"""
+    msg = MIMEMultipart("mixed")
+    msg["Subject"] = "Java Developer - Remote"
+    for subtype, text in parts:
+        msg.attach(MIMEText(text, subtype))
+    return msg
+
+
+INVITE = _message(
+    ("plain", "Interview scheduled for Monday"),
+    ("calendar", "BEGIN:VCALENDAR\nORGANIZER:mailto:jane@acme.com\nEND:VCALENDAR"),
+)
+
+
+@unittest.skipIf(EmailCleaner is None, f"extractor.email.cleaner unavailable: {_cleaner_error}")
+class TestExtractBody(unittest.TestCase):
+
+    def setUp(self):
+        self.cleaner = EmailCleaner()
+
+    def test_index_parts_groups_by_content_type_in_walk_order(self):
+        msg = _message(("plain", "first"), ("html", "<p>html</p>"), ("plain", "second"))
+        parts = self.cleaner.index_parts(msg)
+        self.assertEqual(list(parts), ["multipart/mixed", "text/plain", "text/html"])
+        self.assertEqual([p.get_payload(decode=True) for p in parts["text/plain"]], [b"first", b"second"])
+
+    def test_last_non_empty_plain_part_wins(self):
+        msg = _message(("plain", "Older quoted text"), ("plain", "Hi, we have a Java role"), ("plain", ""))
+        parts = self.cleaner.index_parts(msg)
+        self.assertEqual(self.cleaner._last_decoded_payload(parts["text/plain"]), "Hi, we have a Java role")
+        self.assertEqual(self.cleaner.extract_body(msg, parts), "Hi, we have a Java role")
+        self.assertEqual(self.cleaner.extract_body(msg), "Hi, we have a Java role")
+
+    def test_html_is_used_when_no_plain_text(self):
+        msg = _message(("plain", ""), ("html", "<html><body><p>Senior Data Engineer</p></body></html>"))
+        self.assertEqual(self.cleaner.extract_body(msg), "Senior Data Engineer")
+
+    def test_no_payload_returns_none(self):
+        self.assertIsNone(self.cleaner._last_decoded_payload([]))
+
+
+@unittest.skipIf(
+    EmailCleaner is None or EmailFilter is None,
+    f"extractor.filtering.rules unavailable: {_cleaner_error or _filter_error}",
+)
+class TestCalendarInviteFromParts(unittest.TestCase):
+
+    def setUp(self):
+        self.cleaner = EmailCleaner()
+        # is_calendar_invite reads no instance state
+        self.email_filter = EmailFilter.__new__(EmailFilter)
+
+    def test_calendar_part_detected_from_index(self):
+        parts = self.cleaner.index_parts(INVITE)
+        self.assertTrue(self.email_filter.is_calendar_invite(INVITE, parts))
+        self.assertTrue(self.email_filter.is_calendar_invite(INVITE))
+
+    def test_plain_message_is_not_an_invite(self):
+        msg = _message(("plain", "Hello"), ("html", "<p>Hello</p>"))
+        self.assertFalse(self.email_filter.is_calendar_invite(msg, self.cleaner.index_parts(msg)))
+        self.assertFalse(self.email_filter.is_calendar_invite(msg))
+
+
+if __name__ == "__main__":
+    unittest.main()
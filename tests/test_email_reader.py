@@ -0,0 +1,116 @@
+"""
+Tests for EmailReader batch fetching against fake imaplib responses.
+
+    python -m pytest tests/test_email_reader.py -v
+"""
+
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from extractor.email.reader import EmailReader, _FETCH_UID_RE
+
+
+def _raw(uid):
+    return (
+        f"From: Recruiter {uid} <r{uid}@acme.com>\r\n"
+        f"To: candidate@example.com\r\n"
+        f"Subject: Role {uid}\r\n\r\n"
+        f"Body {uid}\r\n"
+    ).encode()
+
+
+class FakeConnection:
+    """imaplib.IMAP4 stand-in: canned UID SEARCH / UID FETCH responses"""
+
+    def __init__(self, search_uids, batch_response, batch_status='OK'):
+        self.search_uids = search_uids
+        self.batch_response = batch_response
+        self.batch_status = batch_status
+        self.single_fetches = []
+
+    def uid(self, command, *args):
+        if command == 'search':
+            return 'OK', [b' '.join(self.search_uids)]
+        uids, query = args
+        if query == '(UID RFC822)':
+            return self.batch_status, self.batch_response
+        self.single_fetches.append(uids)
+        return 'OK', [(b'1 (RFC822 {%d}' % len(_raw(uids.decode())), _raw(uids.decode())), b')']
+
+
+class FakeConnector:
+    email = 'candidate@example.com'
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def is_connected(self):
+        return True
+
+    def select_folder(self, folder):
+        return True
+
+
+def _literal(header, uid):
+    raw = _raw(uid)
+    return (header + b' {%d}' % len(raw), raw)
+
+
+class TestFetchBatchRaw(unittest.TestCase):
+
+    def _reader(self, batch_response, search_uids=(b'5', b'6', b'7'), batch_status='OK'):
+        connection = FakeConnection(list(search_uids), batch_response, batch_status)
+        return EmailReader(FakeConnector(connection)), connection
+
+    def test_interleaved_flags_updates_are_skipped(self):
+        reader, _ = self._reader([
+            _literal(b'1 (UID 5 RFC822', '5'), b')',
+            b'9 (FLAGS (\\Seen) UID 42)',
+            _literal(b'2 (UID 6 FLAGS (\\Seen) RFC822', '6'), b')',
+        ])
+        raw = reader._fetch_batch_raw([b'5', b'6'])
+        self.assertEqual(sorted(raw), [b'5', b'6'])
+        self.assertEqual(raw[b'6'], _raw('6'))
+
+    def test_uid_after_the_literal(self):
+        reader, _ = self._reader([
+            _literal(b'1 (RFC822', '5'), b' UID 5)',
+            _literal(b'2 (RFC822', '6'), b' UID 6 FLAGS (\\Seen))',
+        ])
+        raw = reader._fetch_batch_raw([b'5', b'6'])
+        self.assertEqual(raw, {b'5': _raw('5'), b'6': _raw('6')})
+
+    def test_uid_is_not_taken_from_the_next_response(self):
+        reader, _ = self._reader([
+            _literal(b'1 (RFC822', '5'),
+            b'9 (FLAGS (\\Seen) UID 42)',
+        ])
+        self.assertEqual(reader._fetch_batch_raw([b'5']), {})
+
+    def test_uid_item_must_be_a_whole_word(self):
+        self.assertEqual(_FETCH_UID_RE.search(b'1 (UID 12 RFC822').group(1), b'12')
+        self.assertIsNone(_FETCH_UID_RE.search(b'1 (XUID 12 RFC822'))
+
+    def test_failed_batch_returns_empty(self):
+        reader, _ = self._reader([], batch_status='NO')
+        self.assertEqual(reader._fetch_batch_raw([b'5']), {})
+
+    def test_missing_uids_fall_back_to_single_fetch(self):
+        reader, connection = self._reader([
+            _literal(b'1 (UID 6 RFC822', '6'), b')',
+            _literal(b'2 (UID 5 RFC822', '5'), b')',
+        ])
+        emails, next_start = reader.fetch_emails(batch_size=10)
+        # Newest first; 7 was absent from the batch response
+        self.assertEqual([e['uid'] for e in emails], ['7', '6', '5'])
+        self.assertEqual([e['subject'] for e in emails], ['Role 7', 'Role 6', 'Role 5'])
+        self.assertEqual(connection.single_fetches, [b'7'])
+        self.assertIsNone(next_start)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Tests for FilterRepository.check_email rule compilation.
+
+    python -m pytest tests/test_filter_repository.py -v
+"""
+
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+try:
+    from extractor.filtering.repository import FilterRepository, _keyword_re, _strip_dot_star, compile_pattern_union
+except ImportError as e:  # connectors need httpx
+    FilterRepository = None
+    _import_error = str(e)
+else:
+    _import_error = ""
+
+
+def _filter(category, keywords, match_type, action, priority):
+    return {
+        'category': category,
+        'keywords': keywords,
+        'match_type': match_type,
+        'action': action,
+        'priority': priority,
+    }
+
+
+SAMPLE_FILTERS = [
+    _filter('allowed_recruiter_domain', 'teksystems\\.com$,^roberthalf\\.com$', 'regex', 'allow', 1),
+    _filter('blocked_localpart_prefix', '^noreply,^no-reply,^(bounce|mailer)[-_.]', 'regex', 'block', 2),
+    _filter('blocked_domain', 'linkedin.com,indeed.com', 'contains', 'block', 3),
+    _filter('blocked_email', '.*alert.*,jobs@[a-z]+\\.io$', 'regex', 'block', 4),
+    _filter('blocked_email_exact', 'spam@example.com', 'exact', 'block', 5),
+]
+
+
+@unittest.skipIf(FilterRepository is None, f"extractor.filtering unavailable: {_import_error}")
+class TestFilterRepositoryRules(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = FilterRepository()
+        self.repo._filters = list(SAMPLE_FILTERS)
+
+    def test_keyword_engine_accepts_every_regex_rule(self):
+        for filter_item in SAMPLE_FILTERS:
+            if filter_item['match_type'] != 'regex':
+                continue
+            for keyword in filter_item['keywords'].split(','):
+                _keyword_re.compile(keyword, _keyword_re.IGNORECASE)
+
+    def test_check_email_verdicts(self):
+        cases = {
+            'jane@teksystems.com': 'allow',
+            'Jane@RobertHalf.com': 'allow',
+            'noreply@acme.com': 'block',
+            'bounce-7@acme.com': 'block',
+            'jobs@careers.linkedin.com': 'block',
+            'job-alerts@acme.com': 'block',
+            'jobs@hiring.io': 'block',
+            'spam@example.com': 'block',
+            'jane.doe@acme.com': None,
+        }
+        for email, expected in cases.items():
+            with self.subTest(email=email):
+                self.assertEqual(self.repo.check_email(email), expected)
+
+    def test_invalid_regex_rule_is_skipped(self):
+        self.repo._filters = [_filter('blocked_email', '([a-z,^noreply', 'regex', 'block', 1)]
+        self.assertEqual(self.repo.check_email('noreply@acme.com'), 'block')
+
+
+@unittest.skipIf(FilterRepository is None, f"extractor.filtering unavailable: {_import_error}")
+class TestCompilePatternUnion(unittest.TestCase):
+
+    def test_plain_patterns_are_fused(self):
+        patterns = compile_pattern_union(['jobs@[a-z]+\\.io$', 'alert', '^no-?reply'])
+        self.assertEqual(len(patterns), 1)
+        self.assertTrue(patterns[0].search('NOREPLY@acme.com'))
+
+    def test_grouped_and_inline_flag_patterns_stay_separate(self):
+        patterns = compile_pattern_union(['(?x) c d', 'job alert', 'digest', '(a)\\1', '(?s)a.b'])
+        self.assertEqual(len(patterns), 4)
+        union = patterns[0]
+        # A leaked (?x) would make the space in 'job alert' insignificant
+        self.assertTrue(union.search('new job alert'))
+        self.assertIsNone(union.search('jobalert'))
+        self.assertTrue(union.search('digest'))
+
+    def test_invalid_patterns_are_dropped(self):
+        self.assertEqual(compile_pattern_union(['([a-z']), [])
+
+
+@unittest.skipIf(FilterRepository is None, f"extractor.filtering unavailable: {_import_error}")
+class TestStripDotStar(unittest.TestCase):
+
+    CASES = {
+        '.*alert.*': 'alert',
+        '^.*alert$': 'alert$',
+        '\\.*': '\\.*',        # escaped dot: a literal '.' repeated, not .*
+        'foo\\\\.*': 'foo\\\\',  # escaped backslash, then a real .*
+        '.*?x': '.*?x',        # lazy quantifier would lead after stripping
+        '^.*$': '$',
+        'a|.*b': 'a|.*b',      # alternation is left alone
+        '.*': '.*',            # nothing left after stripping
+    }
+
+    EMAILS = ('job-alerts@acme.com', 'alert@x.io', 'foo\\@bar.com', 'a.b@c.d', 'xyz@q.com', 'b@c.com', '')
+
+    def test_stripped_keywords(self):
+        for keyword, expected in self.CASES.items():
+            with self.subTest(keyword=keyword):
+                self.assertEqual(_strip_dot_star(keyword), expected)
+
+    def test_stripping_keeps_the_verdict(self):
+        for keyword in self.CASES:
+            original = _keyword_re.compile(keyword, _keyword_re.IGNORECASE)
+            stripped = _keyword_re.compile(_strip_dot_star(keyword), _keyword_re.IGNORECASE)
+            for email in self.EMAILS:
+                with self.subTest(keyword=keyword, email=email):
+                    self.assertEqual(bool(original.search(email)), bool(stripped.search(email)))
+
+
+if __name__ == "__main__":
+    unittest.main()
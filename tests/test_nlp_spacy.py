@@ -0,0 +1,84 @@
+"""
+Tests for SpacyNERExtractor regex helpers that don't need a loaded model.
+
+    python -m pytest tests/test_nlp_spacy.py -v
+"""
+
+import logging
+import os
+import sys
+import unittest
+from email.utils import parseaddr
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+try:
+    from extractor.extraction.nlp_spacy import SpacyNERExtractor, _FROM_HEADER_RE
+except ImportError as e:  # needs spacy, tldextract and httpx
+    SpacyNERExtractor = None
+    _import_error = str(e)
+else:
+    _import_error = ""
+
+
+def _extractor():
+    # The vendor span parser reads no model or filter state
+    extractor = SpacyNERExtractor.__new__(SpacyNERExtractor)
+    extractor.logger = logging.getLogger(__name__)
+    return extractor
+
+
+@unittest.skipIf(SpacyNERExtractor is None, f"extractor.extraction.nlp_spacy unavailable: {_import_error}")
+class TestExtractVendorFromSpan(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = _extractor()
+
+    def test_each_span_form(self):
+        cases = {
+            '<span>John Smith - Acme Corp</span>': ('John Smith', 'Acme Corp'),
+            '<div class="sig">John Smith – Acme Corp</div>': ('John Smith', 'Acme Corp'),
+            '<td>Jane Doe | Tech Corp</td>': ('Jane Doe', 'Tech Corp'),
+            '<b>Jane Doe, Tech Corp Inc.</b>': ('Jane Doe', 'Tech Corp Inc'),
+            '<strong>Mary Major (Globex)</strong>': ('Mary Major', 'Globex'),
+            '<p>Mary Major at Globex Staffing</p>': ('Mary Major', 'Globex Staffing'),
+            'Thanks,\nJohn Smith - Acme Corp\n': ('John Smith', 'Acme Corp'),
+        }
+        for html, (name, company) in cases.items():
+            with self.subTest(html=html):
+                self.assertEqual(self.extractor.extract_vendor_from_span(html), {'name': name, 'company': company})
+
+    def test_no_match(self):
+        for html in ('', '<span>Acme Corp</span>', '<span>John Smith - Acme</div>', '<span>John Smith (Acme</span>'):
+            with self.subTest(html=html):
+                self.assertEqual(self.extractor.extract_vendor_from_span(html), {'name': None, 'company': None})
+
+    def test_company_ending_in_a_parenthetical(self):
+        cases = {
+            '<span>John Smith - Acme Solutions (USA)</span>': ('John Smith', 'Acme Solutions (USA)'),
+            '<td>Jane Doe | Tech Corp (India)</td>': ('Jane Doe', 'Tech Corp (India)'),
+            '<p>Mary Major (Globex (EMEA))</p>': ('Mary Major', 'Globex (EMEA)'),
+        }
+        for html, (name, company) in cases.items():
+            with self.subTest(html=html):
+                self.assertEqual(self.extractor.extract_vendor_from_span(html), {'name': name, 'company': company})
+
+
+@unittest.skipIf(SpacyNERExtractor is None, f"extractor.extraction.nlp_spacy unavailable: {_import_error}")
+class TestFromHeaderFastPath(unittest.TestCase):
+
+    def test_display_name_matches_parseaddr(self):
+        for header in ('John Smith <jsmith@acme.com>', '"Doe, Jane" <jane@acme.com>', '  Mary  Major <m@x.io>'):
+            with self.subTest(header=header):
+                match = _FROM_HEADER_RE.match(header)
+                if match:
+                    name = match.group(1) if match.group(1) is not None else match.group(2)
+                    self.assertEqual(name, parseaddr(header)[0])
+
+    def test_address_comment_falls_back_to_parseaddr(self):
+        self.assertIsNone(_FROM_HEADER_RE.match('John Smith <jsmith@acme.com (work)>'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Tests for RegexExtractor email matching.
+
+    python -m pytest tests/test_patterns.py -v
+"""
+
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+try:
+    from extractor.filtering import repository
+    from extractor.extraction.patterns import RegexExtractor
+except ImportError as e:  # needs phonenumbers and httpx
+    RegexExtractor = None
+    _import_error = str(e)
+else:
+    _import_error = ""
+
+
+@unittest.skipIf(RegexExtractor is None, f"extractor.extraction unavailable: {_import_error}")
+class TestIterEmails(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Empty rule set instead of the API-backed singleton
+        cls._saved_repository = repository._filter_repository
+        repo = repository.FilterRepository()
+        repo._filters = []
+        repository._filter_repository = repo
+        cls.extractor = RegexExtractor()
+
+    @classmethod
+    def tearDownClass(cls):
+        repository._filter_repository = cls._saved_repository
+
+    def test_addresses_in_prose(self):
+        text = "Reach Jane.Doe@Acme.com or bob+jobs@corp.io, not @handle or foo@bar"
+        self.assertEqual(self.extractor.extract_all_emails(text), ["jane.doe@acme.com", "bob+jobs@corp.io"])
+
+    def test_address_directly_after_previous_match(self):
+        self.assertEqual(
+            self.extractor.extract_all_emails("jane@acme.com_bob@corp.com"),
+            ["jane@acme.com", "_bob@corp.com"],
+        )
+        self.assertEqual(
+            self.extractor.extract_all_emails("x@y.io+recruiter@corp.com"),
+            ["x@y.io", "+recruiter@corp.com"],
+        )
+
+    def test_match_does_not_start_inside_a_local_part_run(self):
+        self.assertEqual(self.extractor.extract_all_emails("a" * 5000 + " x@y.com"), ["x@y.com"])
+
+
+if __name__ == "__main__":
+    unittest.main()